@@ -110,9 +110,10 @@ export const api = {
   },
 
   // Trades
-  async getClosedTrades(limit: number = 100, strategyId?: string): Promise<{ count: number; trades: ClosedTrade[]; timestamp: string }> {
+  async getClosedTrades(limit: number = 100, strategyId?: string, cursor?: string): Promise<{ count: number; trades: ClosedTrade[]; next_cursor: string | null; timestamp: string }> {
     const params: any = { limit };
     if (strategyId) params.strategy_id = strategyId;
+    if (cursor) params.cursor = cursor;
 
     const response = await apiClient.get('/trades/closed', { params });
     return response.data;
@@ -61,9 +61,10 @@ export type WebSocketMessage =
   | { type: 'positions_snapshot'; data: Position[]; timestamp: string }
   | { type: 'trade_closed'; data: ClosedTrade }
   | { type: 'price_update'; symbol: string; data: PriceUpdate }
+  | { type: 'price_batch'; symbol: string; data: PriceUpdate[] }
   | { type: 'trailing_sl_update'; data: any }
   | { type: 'system_status'; data: any }
-  | { type: 'pong'; timestamp: string };
+  | { type: 'pong'; timestamp: number };
 
 export type MessageHandler = (message: WebSocketMessage) => void;
 
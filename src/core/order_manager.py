@@ -82,7 +82,7 @@ class OrderManager:
         # Log signal to database before execution
         if self.data_manager:
             try:
-                self.data_manager.log_signal(
+                self.data_manager.log_signal_data(
                     signal_data=signal,
                     approved=True,
                     rejection_reason=None
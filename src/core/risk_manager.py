@@ -126,7 +126,7 @@ class RiskManager:
             # Log to database
             if self.data_manager:
                 try:
-                    self.data_manager.log_signal(
+                    self.data_manager.log_signal_data(
                         signal_data=signal,
                         approved=True,
                         rejection_reason=None
@@ -144,7 +144,7 @@ class RiskManager:
 
             if self.data_manager:
                 try:
-                    self.data_manager.log_signal(
+                    self.data_manager.log_signal_data(
                         signal_data=signal,
                         approved=False,
                         rejection_reason=reason
@@ -163,7 +163,7 @@ class RiskManager:
 
                 if self.data_manager:
                     try:
-                        self.data_manager.log_signal(
+                        self.data_manager.log_signal_data(
                             signal_data=signal,
                             approved=False,
                             rejection_reason=reason
@@ -184,7 +184,7 @@ class RiskManager:
 
                 if self.data_manager:
                     try:
-                        self.data_manager.log_signal(
+                        self.data_manager.log_signal_data(
                             signal_data=signal,
                             approved=False,
                             rejection_reason=reason
@@ -206,7 +206,7 @@ class RiskManager:
             # Log rejection to database
             if self.data_manager:
                 try:
-                    self.data_manager.log_signal(
+                    self.data_manager.log_signal_data(
                         signal_data=signal,
                         approved=False,
                         rejection_reason=reason
@@ -229,7 +229,7 @@ class RiskManager:
                 # Log rejection to database
                 if self.data_manager:
                     try:
-                        self.data_manager.log_signal(
+                        self.data_manager.log_signal_data(
                             signal_data=signal,
                             approved=False,
                             rejection_reason=reason
@@ -249,7 +249,7 @@ class RiskManager:
                 # Log rejection to database
                 if self.data_manager:
                     try:
-                        self.data_manager.log_signal(
+                        self.data_manager.log_signal_data(
                             signal_data=signal,
                             approved=False,
                             rejection_reason=reason
@@ -270,7 +270,7 @@ class RiskManager:
             # Log rejection to database
             if self.data_manager:
                 try:
-                    self.data_manager.log_signal(
+                    self.data_manager.log_signal_data(
                         signal_data=signal,
                         approved=False,
                         rejection_reason=reason
@@ -289,7 +289,7 @@ class RiskManager:
         # Log approval to database
         if self.data_manager:
             try:
-                self.data_manager.log_signal(
+                self.data_manager.log_signal_data(
                     signal_data=signal,
                     approved=True,
                     rejection_reason=None
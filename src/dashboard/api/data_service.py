@@ -3,18 +3,70 @@ Data Service Layer for Analytics Dashboard
 Provides unified access to InfluxDB, Redis, and SQLite data
 """
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterator
 from datetime import datetime, timedelta
+import numpy as np
 from influxdb_client import InfluxDBClient
 import redis
+from redis.utils import HIREDIS_AVAILABLE
 import sqlite3
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import json
 
-logger = logging.getLogger(__name__)
+from database.influx_manager import trade_slot
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Flux queries are static text; per-request values are bound through params,
+# which influxdb-client declares as options, so templates use the bare names
+PRICE_HISTORY_QUERY = '''
+    from(bucket: bucket)
+    |> range(start: duration(v: start))
+    |> filter(fn: (r) => r._measurement == "ticks")
+    |> filter(fn: (r) => r.symbol == symbol)
+    |> filter(fn: (r) => r._field == "price")
+    |> aggregateWindow(every: duration(v: every), fn: last, createEmpty: false)
+    |> sort(columns: ["_time"])
+'''
+
+TRAILING_SL_FIELDS = ('current_sl', 'highest_price')
+
+TRAILING_SL_HISTORY_QUERY = '''
+    from(bucket: bucket)
+    |> range(start: -24h)
+    |> filter(fn: (r) => r._measurement == "trailing_sl")
+    |> filter(fn: (r) => r.trade_slot == trade_slot)
+    |> pivot(rowKey: ["_time"], columnKey: ["_field"], valueColumn: "_value")
+    |> filter(fn: (r) => r.trade_id == trade_id)
+    |> sort(columns: ["_time"])
+'''
+
+
+def _max_streaks(wins: np.ndarray) -> Tuple[int, int]:
+    """Longest run of winners and of losers in a boolean win mask"""
+    if wins.size == 0:
+        return 0, 0
+
+    # Run-length encode: a new run starts wherever the win/loss state flips
+    starts = np.concatenate(([0], np.flatnonzero(wins[1:] != wins[:-1]) + 1))
+    lengths = np.diff(np.append(starts, wins.size))
+    run_is_win = wins[starts]
+
+    win_runs = lengths[run_is_win]
+    loss_runs = lengths[~run_is_win]
+    return (int(win_runs.max()) if win_runs.size else 0,
+            int(loss_runs.max()) if loss_runs.size else 0)
+
+
+@dataclass(slots=True)
 class Position:
     """Current position data"""
     strategy_id: str
@@ -30,7 +82,7 @@ class Position:
     trade_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosedTrade:
     """Closed trade data"""
     trade_id: str
@@ -48,8 +100,13 @@ class ClosedTrade:
     max_favorable_excursion: Optional[float] = None
     max_adverse_excursion: Optional[float] = None
 
+    @property
+    def page_cursor(self) -> str:
+        """Keyset cursor for the page after this trade: "exit_time|trade_id" """
+        return f"{self.exit_time}|{self.trade_id}"
 
-@dataclass
+
+@dataclass(slots=True)
 class StrategyMetrics:
     """Strategy performance metrics"""
     strategy_id: str
@@ -66,7 +123,7 @@ class StrategyMetrics:
     avg_trade_duration_minutes: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """Price and trailing SL data for charts"""
     timestamp: str
@@ -86,15 +143,27 @@ class DataService:
                  influx_bucket: str = "trading",
                  redis_host: str = "localhost",
                  redis_port: int = 6379,
-                 sqlite_path: str = "data/velox.db"):
+                 sqlite_path: str = "data/velox.db",
+                 cache_ttl: float = 1.0,
+                 influx_pool_size: int = 32,
+                 redis_pool_size: int = 32):
         """Initialize data service connections"""
 
+        # Short-lived cache so bursty dashboard polls share one backend read
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+
         # InfluxDB client
         try:
+            # One pooled, gzip-enabled HTTP client shared by all dashboard queries
             self.influx_client = InfluxDBClient(
                 url=influx_url,
                 token=influx_token,
-                org=influx_org
+                org=influx_org,
+                enable_gzip=True,
+                timeout=10_000,
+                connection_pool_maxsize=influx_pool_size
             )
             self.query_api = self.influx_client.query_api()
             self.influx_bucket = influx_bucket
@@ -107,29 +176,82 @@ class DataService:
 
         # Redis client
         try:
-            self.redis_client = redis.Redis(
+            # Bounded pool shared by all threadpool handlers
+            self.redis_pool = redis.ConnectionPool(
                 host=redis_host,
                 port=redis_port,
-                decode_responses=True
+                decode_responses=True,
+                max_connections=redis_pool_size
             )
+            self.redis_client = redis.Redis(connection_pool=self.redis_pool)
             self.redis_client.ping()
-            logger.info("Redis connection established")
+            logger.info(f"Redis connection established (hiredis parser: {HIREDIS_AVAILABLE})")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.redis_client = None
+            self.redis_pool = None
 
         # SQLite connection
         self.sqlite_path = sqlite_path
         logger.info(f"SQLite path: {sqlite_path}")
+        self._ensure_sqlite_indexes()
 
     def _get_sqlite_connection(self):
         """Get SQLite connection"""
         return sqlite3.connect(self.sqlite_path)
 
+    def _ensure_sqlite_indexes(self):
+        """Create composite indexes matching the dashboard's hot predicates"""
+        try:
+            conn = self._get_sqlite_connection()
+            cursor = conn.cursor()
+
+            # status='CLOSED' ORDER BY exit_time DESC
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_closed_exit
+                ON trades(status, exit_time DESC)
+            """)
+            # strategy_id = ? AND status='CLOSED' ORDER BY exit_time
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_strategy_closed
+                ON trades(strategy_id, status, exit_time)
+            """)
+            # status='OPEN' AND entry_time < ...
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_open_entry
+                ON trades(status, entry_time)
+            """)
+            cursor.execute("ANALYZE trades")
+
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.warning(f"Could not create SQLite indexes: {e}")
+
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached value younger than cache_ttl, otherwise reload it"""
+        if self.cache_ttl <= 0:
+            return loader()
+
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        value = loader()
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, value)
+        return value
+
     # ========== POSITIONS ==========
 
     def get_open_positions(self) -> List[Position]:
         """Get all currently open positions from Redis"""
+        return self._cached('open_positions', self._load_open_positions)
+
+    def _load_open_positions(self) -> List[Position]:
+        """Read all open positions from Redis"""
         if not self.redis_client:
             return []
 
@@ -140,7 +262,7 @@ class DataService:
                 try:
                     data = self.redis_client.get(key)
                     if data:
-                        pos_data = json.loads(data)
+                        pos_data = json_loads(data)
 
                         # Get trailing SL if available
                         trade_id = pos_data.get('trade_id')
@@ -148,7 +270,7 @@ class DataService:
                         if trade_id:
                             sl_data = self.redis_client.get(f"sl:{trade_id}")
                             if sl_data:
-                                sl_info = json.loads(sl_data)
+                                sl_info = json_loads(sl_data)
                                 trailing_sl = sl_info.get('current_sl')
 
                         position = Position(
@@ -158,7 +280,7 @@ class DataService:
                             entry_price=pos_data.get('entry_price', 0.0),
                             current_price=pos_data.get('current_price', 0.0),
                             highest_price=pos_data.get('highest_price', 0.0),
-                            entry_time=pos_data.get('entry_time', ''),
+                            entry_time=self._position_entry_time(pos_data),
                             unrealized_pnl=pos_data.get('unrealized_pnl', 0.0),
                             unrealized_pnl_pct=pos_data.get('unrealized_pnl_pct', 0.0),
                             trailing_sl=trailing_sl,
@@ -173,6 +295,14 @@ class DataService:
 
         return positions
 
+    @staticmethod
+    def _position_entry_time(pos_data: dict) -> str:
+        """ISO entry time from a cached position (epoch-ns or legacy ISO string)"""
+        entry_time_ns = pos_data.get('entry_time_ns')
+        if entry_time_ns is not None:
+            return datetime.fromtimestamp(entry_time_ns / 1e9).isoformat()
+        return pos_data.get('entry_time', '')
+
     def get_position_by_symbol(self, symbol: str, strategy_id: Optional[str] = None) -> Optional[Position]:
         """Get position for a specific symbol"""
         positions = self.get_open_positions()
@@ -186,11 +316,27 @@ class DataService:
 
     # ========== CLOSED TRADES ==========
 
-    def get_closed_trades(self, limit: int = 100, strategy_id: Optional[str] = None) -> List[ClosedTrade]:
+    def get_closed_trades(self, limit: int = 100, strategy_id: Optional[str] = None,
+                          cursor: Optional[str] = None) -> List[ClosedTrade]:
         """Get closed trades from SQLite"""
+        return list(self.iter_closed_trades(limit=limit, strategy_id=strategy_id,
+                                            cursor=cursor))
+
+    def iter_closed_trades(self, limit: int = 100, strategy_id: Optional[str] = None,
+                           cursor: Optional[str] = None) -> Iterator[ClosedTrade]:
+        """
+        Yield closed trades from SQLite one row at a time, newest exit first.
+
+        cursor is a keyset cursor: pass the page_cursor ("exit_time|trade_id") of
+        the last trade of the previous page to continue from there without an
+        OFFSET scan. trade_id breaks ties, so trades that closed on the same tick
+        are never skipped; a bare exit_time resumes strictly before that time.
+        """
+        conn = None
         try:
-            conn = self._get_sqlite_connection()
-            cursor = conn.cursor()
+            # Streaming responses may resume the generator on a different worker thread
+            conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            db_cursor = conn.cursor()
 
             query = """
                 SELECT
@@ -206,16 +352,18 @@ class DataService:
                 query += " AND strategy_id = ?"
                 params.append(strategy_id)
 
-            query += " ORDER BY exit_time DESC LIMIT ?"
+            if cursor:
+                exit_time, _, trade_id = cursor.partition('|')
+                query += " AND (exit_time, trade_id) < (?, ?)"
+                params.extend((exit_time, trade_id))
+
+            query += " ORDER BY exit_time DESC, trade_id DESC LIMIT ?"
             params.append(limit)
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
+            db_cursor.execute(query, params)
 
-            trades = []
-            for row in rows:
-                trade = ClosedTrade(
+            for row in db_cursor:
+                yield ClosedTrade(
                     trade_id=row[0],
                     strategy_id=row[1],
                     symbol=row[2],
@@ -231,12 +379,121 @@ class DataService:
                     max_favorable_excursion=row[12],
                     max_adverse_excursion=row[13]
                 )
-                trades.append(trade)
-
-            return trades
         except Exception as e:
             logger.error(f"Error getting closed trades: {e}")
-            return []
+        finally:
+            if conn:
+                conn.close()
+
+    def get_closed_trades_summary(self, limit: int = 100) -> Dict[str, Any]:
+        """Aggregate count, wins, losses and P&L over the most recent closed trades"""
+        summary = {
+            'count': 0,
+            'winning_trades': 0,
+            'losing_trades': 0,
+            'total_pnl': 0.0,
+            'gross_profit': 0.0,
+            'gross_loss': 0.0
+        }
+
+        try:
+            conn = self._get_sqlite_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    COUNT(*),
+                    SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN pnl <= 0 THEN 1 ELSE 0 END),
+                    SUM(pnl),
+                    SUM(CASE WHEN pnl > 0 THEN pnl ELSE 0 END),
+                    SUM(CASE WHEN pnl <= 0 THEN ABS(pnl) ELSE 0 END)
+                FROM (
+                    SELECT pnl FROM trades
+                    WHERE status = 'CLOSED'
+                    ORDER BY exit_time DESC
+                    LIMIT ?
+                )
+            """, (limit,))
+
+            row = cursor.fetchone()
+            conn.close()
+
+            if row:
+                summary['count'] = row[0] or 0
+                summary['winning_trades'] = row[1] or 0
+                summary['losing_trades'] = row[2] or 0
+                summary['total_pnl'] = row[3] or 0.0
+                summary['gross_profit'] = row[4] or 0.0
+                summary['gross_loss'] = row[5] or 0.0
+        except Exception as e:
+            logger.error(f"Error getting closed trades summary: {e}")
+
+        return summary
+
+    def get_symbol_performance(self, limit: int = 500) -> Dict[str, Dict[str, Any]]:
+        """Per-symbol trade count, wins, P&L and win rate over the latest closed trades"""
+        performance = {}
+        try:
+            conn = self._get_sqlite_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    symbol,
+                    COUNT(*),
+                    SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END),
+                    SUM(pnl)
+                FROM (
+                    SELECT symbol, pnl FROM trades
+                    WHERE status = 'CLOSED'
+                    ORDER BY exit_time DESC
+                    LIMIT ?
+                )
+                GROUP BY symbol
+            """, (limit,))
+
+            for symbol, trades, wins, total_pnl in cursor.fetchall():
+                performance[symbol] = {
+                    'trades': trades,
+                    'wins': wins or 0,
+                    'total_pnl': total_pnl or 0,
+                    'win_rate': ((wins or 0) / trades * 100) if trades > 0 else 0
+                }
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error getting symbol performance: {e}")
+
+        return performance
+
+    def get_exit_reason_performance(self, limit: int = 500) -> Dict[str, Dict[str, Any]]:
+        """Per-exit-reason trade count and P&L over the latest closed trades"""
+        performance = {}
+        try:
+            conn = self._get_sqlite_connection()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT exit_reason, COUNT(*), SUM(pnl)
+                FROM (
+                    SELECT exit_reason, pnl FROM trades
+                    WHERE status = 'CLOSED'
+                    ORDER BY exit_time DESC
+                    LIMIT ?
+                )
+                GROUP BY exit_reason
+            """, (limit,))
+
+            for reason, count, total_pnl in cursor.fetchall():
+                performance[reason] = {
+                    'count': count,
+                    'total_pnl': total_pnl or 0
+                }
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error getting exit reason performance: {e}")
+
+        return performance
 
     # ========== STRATEGY METRICS ==========
 
@@ -284,24 +541,11 @@ class DataService:
                 ORDER BY exit_time
             """, (strategy_id,))
 
-            trades = cursor.fetchall()
+            rows = cursor.fetchall()
             conn.close()
 
-            max_consecutive_wins = 0
-            max_consecutive_losses = 0
-            current_wins = 0
-            current_losses = 0
-
-            for trade in trades:
-                pnl = trade[0]
-                if pnl > 0:
-                    current_wins += 1
-                    current_losses = 0
-                    max_consecutive_wins = max(max_consecutive_wins, current_wins)
-                else:
-                    current_losses += 1
-                    current_wins = 0
-                    max_consecutive_losses = max(max_consecutive_losses, current_losses)
+            pnls = np.fromiter((row[0] or 0.0 for row in rows), dtype=np.float64, count=len(rows))
+            max_consecutive_wins, max_consecutive_losses = _max_streaks(pnls > 0)
 
             return StrategyMetrics(
                 strategy_id=strategy_id,
@@ -321,18 +565,35 @@ class DataService:
             logger.error(f"Error calculating strategy metrics: {e}")
             return None
 
+    def _get_strategy_ids(self) -> List[str]:
+        """Strategy IDs from the Redis 'strategies' set, falling back to SQLite"""
+        if self.redis_client:
+            try:
+                strategies = self.redis_client.smembers("strategies")
+                if strategies:
+                    return sorted(strategies)
+            except Exception as e:
+                logger.error(f"Error reading strategies set from Redis: {e}")
+
+        conn = self._get_sqlite_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT DISTINCT strategy_id FROM trades WHERE status = 'CLOSED'
+        """)
+
+        strategies = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return strategies
+
     def get_all_strategy_metrics(self) -> Dict[str, StrategyMetrics]:
         """Get metrics for all strategies"""
-        try:
-            conn = self._get_sqlite_connection()
-            cursor = conn.cursor()
+        return self._cached('all_strategy_metrics', self._load_all_strategy_metrics)
 
-            cursor.execute("""
-                SELECT DISTINCT strategy_id FROM trades WHERE status = 'CLOSED'
-            """)
-
-            strategies = [row[0] for row in cursor.fetchall()]
-            conn.close()
+    def _load_all_strategy_metrics(self) -> Dict[str, StrategyMetrics]:
+        """Calculate metrics for every strategy with closed trades"""
+        try:
+            strategies = self._get_strategy_ids()
 
             metrics = {}
             for strategy_id in strategies:
@@ -347,37 +608,39 @@ class DataService:
 
     # ========== PRICE & INDICATOR DATA ==========
 
-    def get_price_history(self, symbol: str, hours: int = 1) -> List[PriceData]:
-        """Get price history from InfluxDB"""
+    def get_price_history(self, symbol: str, hours: int = 1,
+                          resolution_points: int = 2000) -> List[PriceData]:
+        """Get price history from InfluxDB, downsampled to ~resolution_points"""
+        return list(self.iter_price_history(symbol, hours=hours, resolution_points=resolution_points))
+
+    def iter_price_history(self, symbol: str, hours: int = 1,
+                           resolution_points: int = 2000) -> Iterator[PriceData]:
+        """Yield price history points from InfluxDB as they are parsed"""
         if not self.query_api:
-            return []
+            return
 
         try:
-            query = f'''
-                from(bucket: "{self.influx_bucket}")
-                |> range(start: -{hours}h)
-                |> filter(fn: (r) => r._measurement == "ticks")
-                |> filter(fn: (r) => r.symbol == "{symbol}")
-                |> filter(fn: (r) => r._field == "price")
-                |> sort(columns: ["_time"])
-            '''
-
-            result = self.query_api.query(query, org=self.influx_org)
-
-            prices = []
-            for table in result:
-                for record in table.records:
-                    price_data = PriceData(
-                        timestamp=record.get_time().isoformat(),
-                        symbol=symbol,
-                        price=record.get_value()
-                    )
-                    prices.append(price_data)
-
-            return prices
+            # Downsample server-side so long ranges don't ship every raw tick
+            every_seconds = max(1, (hours * 3600) // max(1, resolution_points))
+
+            params = {
+                "bucket": self.influx_bucket,
+                "start": f"-{hours}h",
+                "every": f"{every_seconds}s",
+                "symbol": symbol
+            }
+
+            # Stream records as they are parsed instead of buffering every FluxTable
+            records = self.query_api.query_stream(PRICE_HISTORY_QUERY, org=self.influx_org, params=params)
+
+            for record in records:
+                yield PriceData(
+                    timestamp=record.get_time().isoformat(),
+                    symbol=symbol,
+                    price=record.get_value()
+                )
         except Exception as e:
             logger.error(f"Error getting price history for {symbol}: {e}")
-            return []
 
     def get_trailing_sl_history(self, trade_id: str) -> List[Dict[str, Any]]:
         """Get trailing SL updates from InfluxDB"""
@@ -385,24 +648,27 @@ class DataService:
             return []
 
         try:
-            query = f'''
-                from(bucket: "{self.influx_bucket}")
-                |> range(start: -24h)
-                |> filter(fn: (r) => r._measurement == "trailing_sl")
-                |> filter(fn: (r) => r.trade_id == "{trade_id}")
-                |> sort(columns: ["_time"])
-            '''
+            params = {
+                "bucket": self.influx_bucket,
+                "trade_id": trade_id,
+                # Narrows the scan to one slot's series before the pivot
+                "trade_slot": trade_slot(trade_id)
+            }
 
-            result = self.query_api.query(query, org=self.influx_org)
+            records = self.query_api.query_stream(TRAILING_SL_HISTORY_QUERY, org=self.influx_org, params=params)
 
+            # trade_id is a field, so rows come back pivoted: one per update
             sl_updates = []
-            for table in result:
-                for record in table.records:
-                    sl_updates.append({
-                        'timestamp': record.get_time().isoformat(),
-                        'field': record.get_field(),
-                        'value': record.get_value()
-                    })
+            for record in records:
+                timestamp = record.get_time().isoformat()
+                for field in TRAILING_SL_FIELDS:
+                    value = record.values.get(field)
+                    if value is not None:
+                        sl_updates.append({
+                            'timestamp': timestamp,
+                            'field': field,
+                            'value': value
+                        })
 
             return sl_updates
         except Exception as e:
@@ -418,7 +684,7 @@ class DataService:
             key = f"indicators:{symbol}:{strategy_id}"
             data = self.redis_client.get(key)
             if data:
-                return json.loads(data)
+                return json_loads(data)
         except Exception as e:
             logger.error(f"Error getting indicators for {symbol}: {e}")
 
@@ -428,23 +694,22 @@ class DataService:
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get overall system status"""
-        status = {
+        return self._cached('system_status',
+                            lambda: self.status_from_positions(self.get_open_positions()))
+
+    def status_from_positions(self, positions: List[Position]) -> Dict[str, Any]:
+        """Build system status from an already-fetched list of open positions"""
+        return {
             'timestamp': datetime.now().isoformat(),
             'databases': {
                 'redis': self.redis_client is not None,
                 'influxdb': self.influx_client is not None,
                 'sqlite': True  # Always true if we can connect
             },
-            'open_positions_count': len(self.get_open_positions()),
-            'total_pnl': 0.0
+            'open_positions_count': len(positions),
+            'total_pnl': sum(pos.unrealized_pnl for pos in positions)
         }
 
-        # Calculate total P&L from open positions
-        positions = self.get_open_positions()
-        status['total_pnl'] = sum(pos.unrealized_pnl for pos in positions)
-
-        return status
-
     # ========== ORDER TRACKING ==========
 
     def get_unclosed_orders(self) -> List[Dict[str, Any]]:
@@ -488,3 +753,4 @@ class DataService:
             self.influx_client.close()
         if self.redis_client:
             self.redis_client.close()
+            self.redis_pool.disconnect()
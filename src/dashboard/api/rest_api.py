@@ -2,13 +2,16 @@
 REST API for VELOX Analytics Dashboard
 Provides endpoints for historical data, analytics, and diagnostics
 """
+import asyncio
+import hashlib
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from dataclasses import asdict
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+import orjson
 import uvicorn
 
 from .data_service import DataService
@@ -19,7 +22,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="VELOX Analytics Dashboard API",
     description="Professional trading analytics and monitoring API",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -32,8 +36,98 @@ app.add_middleware(
 )
 
 # Initialize data service
+# DataService talks to Redis/SQLite/InfluxDB through blocking clients, so handlers
+# that use it are plain `def` and FastAPI runs them on its worker threadpool
+# instead of stalling the event loop.
 data_service = DataService()
 
+# Hot endpoints are backed by the data service TTL cache; let clients reuse it too.
+# Endpoints that return dataclasses hand them to ORJSONResponse directly, which
+# serializes them natively and skips the asdict() copy and jsonable_encoder walk.
+HOT_CACHE_HEADERS = {"Cache-Control": f"max-age={max(1, int(data_service.cache_ttl))}"}
+
+# Streamed list endpoints flush roughly one TCP segment of JSON at a time
+STREAM_CHUNK_BYTES = 1490
+
+# /api/positions and /api/status are served from bytes encoded in the background
+SNAPSHOT_REFRESH_SECONDS = 0.5
+app.state.snapshots = {}
+
+
+def _encode_snapshot(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    """Encode payload once; the ETag ignores the timestamp so unchanged data revalidates"""
+    data = {k: v for k, v in payload.items() if k != 'timestamp'}
+    etag = '"' + hashlib.blake2b(orjson.dumps(data), digest_size=8).hexdigest() + '"'
+    return orjson.dumps(payload), etag
+
+
+def _refresh_snapshots() -> Dict[str, Tuple[bytes, str]]:
+    """Rebuild the pre-encoded positions and status payloads"""
+    positions = data_service.get_open_positions()
+    app.state.snapshots = {
+        'positions': _encode_snapshot({
+            "count": len(positions),
+            "positions": positions,
+            "timestamp": datetime.now().isoformat()
+        }),
+        'status': _encode_snapshot(data_service.status_from_positions(positions))
+    }
+    return app.state.snapshots
+
+
+async def _snapshot_refresher():
+    """Keep the pre-encoded snapshots fresh off the request path"""
+    while True:
+        try:
+            await run_in_threadpool(_refresh_snapshots)
+        except Exception as e:
+            logger.error(f"Error refreshing snapshots: {e}")
+        await asyncio.sleep(SNAPSHOT_REFRESH_SECONDS)
+
+
+def _snapshot_response(request: Request, name: str) -> Response:
+    """Serve a pre-encoded snapshot, answering 304 when the client's ETag matches"""
+    snapshots = app.state.snapshots or _refresh_snapshots()
+    body, etag = snapshots[name]
+    headers = dict(HOT_CACHE_HEADERS, ETag=etag)
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _stream_json_list(key: str, items, extra: Optional[dict] = None,
+                      cursor_attr: Optional[str] = None, page_size: Optional[int] = None):
+    """
+    Encode {key: [items...], **extra, count, timestamp} incrementally.
+
+    The list is written first so rows leave the server as they are produced;
+    count and timestamp are only known at the end and close the object.
+    With cursor_attr set, a full page also carries next_cursor taken from
+    that attribute of the last item.
+    """
+    buffer = bytearray(b'{"' + key.encode() + b'":[')
+    count = 0
+    last = None
+
+    for item in items:
+        if count:
+            buffer += b','
+        buffer += orjson.dumps(item)
+        count += 1
+        last = item
+
+        if len(buffer) >= STREAM_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+
+    tail = dict(extra or {}, count=count, timestamp=datetime.now().isoformat())
+    if cursor_attr:
+        tail['next_cursor'] = getattr(last, cursor_attr) if last is not None and count == page_size else None
+    buffer += b'],' + orjson.dumps(tail)[1:]
+    yield bytes(buffer)
+
 
 # ========== HEALTH & STATUS ==========
 
@@ -49,7 +143,7 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint"""
     status = data_service.get_system_status()
     return {
@@ -60,57 +154,61 @@ async def health_check():
 
 
 @app.get("/api/status")
-async def get_status():
+def get_status(request: Request):
     """Get overall system status"""
-    return data_service.get_system_status()
+    return _snapshot_response(request, 'status')
 
 
 # ========== POSITIONS ==========
 
 @app.get("/api/positions")
-async def get_positions():
+def get_positions(request: Request):
     """Get all open positions"""
-    positions = data_service.get_open_positions()
-    return {
-        "count": len(positions),
-        "positions": [asdict(pos) for pos in positions],
-        "timestamp": datetime.now().isoformat()
-    }
+    return _snapshot_response(request, 'positions')
 
 
 @app.get("/api/positions/{symbol}")
-async def get_position(symbol: str, strategy_id: Optional[str] = None):
+def get_position(symbol: str, strategy_id: Optional[str] = None):
     """Get position for specific symbol"""
     position = data_service.get_position_by_symbol(symbol, strategy_id)
 
     if not position:
         raise HTTPException(status_code=404, detail=f"Position not found for {symbol}")
 
-    return {
-        "position": asdict(position),
+    return ORJSONResponse({
+        "position": position,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 
 # ========== TRADES ==========
 
 @app.get("/api/trades/closed")
-async def get_closed_trades(
+def get_closed_trades(
     limit: int = Query(100, ge=1, le=1000),
-    strategy_id: Optional[str] = None
+    strategy_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    before_exit_time: Optional[str] = None
 ):
-    """Get closed trades with optional filtering"""
-    trades = data_service.get_closed_trades(limit=limit, strategy_id=strategy_id)
+    """
+    Get closed trades with optional filtering; page with next_cursor -> cursor.
+
+    before_exit_time is the older exit_time-only cursor and is still accepted.
+    """
+    trades = data_service.iter_closed_trades(
+        limit=limit,
+        strategy_id=strategy_id,
+        cursor=cursor or before_exit_time
+    )
 
-    return {
-        "count": len(trades),
-        "trades": [asdict(trade) for trade in trades],
-        "timestamp": datetime.now().isoformat()
-    }
+    return StreamingResponse(
+        _stream_json_list("trades", trades, cursor_attr="page_cursor", page_size=limit),
+        media_type="application/json"
+    )
 
 
 @app.get("/api/trades/unclosed")
-async def get_unclosed_orders():
+def get_unclosed_orders():
     """Get orders that might not be properly closed"""
     unclosed = data_service.get_unclosed_orders()
 
@@ -124,51 +222,50 @@ async def get_unclosed_orders():
 # ========== STRATEGY METRICS ==========
 
 @app.get("/api/strategies")
-async def get_all_strategies():
+def get_all_strategies():
     """Get all strategy metrics"""
     metrics = data_service.get_all_strategy_metrics()
 
-    return {
+    return ORJSONResponse({
         "count": len(metrics),
-        "strategies": {k: asdict(v) for k, v in metrics.items()},
+        "strategies": metrics,
         "timestamp": datetime.now().isoformat()
-    }
+    }, headers=HOT_CACHE_HEADERS)
 
 
 @app.get("/api/strategies/{strategy_id}")
-async def get_strategy_metrics(strategy_id: str):
+def get_strategy_metrics(strategy_id: str):
     """Get metrics for specific strategy"""
     metrics = data_service.get_strategy_metrics(strategy_id)
 
     if not metrics:
         raise HTTPException(status_code=404, detail=f"No metrics found for strategy {strategy_id}")
 
-    return {
-        "strategy": asdict(metrics),
+    return ORJSONResponse({
+        "strategy": metrics,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 
 # ========== PRICE & CHART DATA ==========
 
 @app.get("/api/price/{symbol}")
-async def get_price_history(
+def get_price_history(
     symbol: str,
-    hours: int = Query(1, ge=1, le=24)
+    hours: int = Query(1, ge=1, le=24),
+    points: int = Query(2000, ge=100, le=10000)
 ):
     """Get price history for symbol"""
-    prices = data_service.get_price_history(symbol, hours=hours)
+    prices = data_service.iter_price_history(symbol, hours=hours, resolution_points=points)
 
-    return {
-        "symbol": symbol,
-        "count": len(prices),
-        "prices": [asdict(p) for p in prices],
-        "timestamp": datetime.now().isoformat()
-    }
+    return StreamingResponse(
+        _stream_json_list("prices", prices, {"symbol": symbol}),
+        media_type="application/json"
+    )
 
 
 @app.get("/api/indicators/{symbol}/{strategy_id}")
-async def get_indicators(symbol: str, strategy_id: str):
+def get_indicators(symbol: str, strategy_id: str):
     """Get current indicator values"""
     indicators = data_service.get_indicator_values(symbol, strategy_id)
 
@@ -181,7 +278,7 @@ async def get_indicators(symbol: str, strategy_id: str):
 
 
 @app.get("/api/trailing-sl/{trade_id}")
-async def get_trailing_sl_history(trade_id: str):
+def get_trailing_sl_history(trade_id: str):
     """Get trailing stop-loss history for a trade"""
     sl_history = data_service.get_trailing_sl_history(trade_id)
 
@@ -196,24 +293,24 @@ async def get_trailing_sl_history(trade_id: str):
 # ========== ANALYTICS ==========
 
 @app.get("/api/analytics/summary")
-async def get_analytics_summary():
+def get_analytics_summary():
     """Get comprehensive analytics summary"""
     positions = data_service.get_open_positions()
-    closed_trades = data_service.get_closed_trades(limit=100)
+    closed_summary = data_service.get_closed_trades_summary(limit=100)
     strategy_metrics = data_service.get_all_strategy_metrics()
-    system_status = data_service.get_system_status()
+    system_status = data_service.status_from_positions(positions)
 
     # Calculate summary metrics
     total_unrealized_pnl = sum(pos.unrealized_pnl for pos in positions)
-    total_realized_pnl = sum(trade.pnl for trade in closed_trades)
+    total_realized_pnl = closed_summary['total_pnl']
     total_pnl = total_unrealized_pnl + total_realized_pnl
 
-    winning_trades = sum(1 for trade in closed_trades if trade.pnl > 0)
-    losing_trades = sum(1 for trade in closed_trades if trade.pnl <= 0)
-    total_closed = len(closed_trades)
+    winning_trades = closed_summary['winning_trades']
+    losing_trades = closed_summary['losing_trades']
+    total_closed = closed_summary['count']
     win_rate = (winning_trades / total_closed * 100) if total_closed > 0 else 0
 
-    return {
+    return ORJSONResponse({
         "summary": {
             "open_positions": len(positions),
             "total_unrealized_pnl": total_unrealized_pnl,
@@ -224,84 +321,53 @@ async def get_analytics_summary():
             "losing_trades": losing_trades,
             "win_rate": win_rate
         },
-        "strategies": {k: asdict(v) for k, v in strategy_metrics.items()},
+        "strategies": strategy_metrics,
         "system_status": system_status,
         "timestamp": datetime.now().isoformat()
-    }
+    }, headers=HOT_CACHE_HEADERS)
 
 
 @app.get("/api/analytics/performance")
-async def get_performance_analysis():
+def get_performance_analysis():
     """Get detailed performance analysis"""
-    closed_trades = data_service.get_closed_trades(limit=500)
+    # Totals and groupings are aggregated by SQLite over the latest 500 trades
+    summary = data_service.get_closed_trades_summary(limit=500)
 
-    if not closed_trades:
+    if not summary['count']:
         return {
             "error": "No closed trades found",
             "timestamp": datetime.now().isoformat()
         }
 
-    # Performance metrics
-    total_trades = len(closed_trades)
-    winners = [t for t in closed_trades if t.pnl > 0]
-    losers = [t for t in closed_trades if t.pnl <= 0]
+    total_trades = summary['count']
+    winners_count = summary['winning_trades']
+    losers_count = summary['losing_trades']
+    total_win = summary['gross_profit']
+    total_loss = summary['gross_loss']
 
-    total_win = sum(t.pnl for t in winners)
-    total_loss = sum(abs(t.pnl) for t in losers)
-
-    avg_win = total_win / len(winners) if winners else 0
-    avg_loss = total_loss / len(losers) if losers else 0
+    avg_win = total_win / winners_count if winners_count else 0
+    avg_loss = total_loss / losers_count if losers_count else 0
 
     profit_factor = total_win / total_loss if total_loss > 0 else 0
-    win_rate = (len(winners) / total_trades * 100) if total_trades > 0 else 0
+    win_rate = (winners_count / total_trades * 100) if total_trades > 0 else 0
 
     # Calculate expectancy
-    expectancy = (avg_win * len(winners) - avg_loss * len(losers)) / total_trades if total_trades > 0 else 0
-
-    # Group by symbol
-    symbol_performance = {}
-    for trade in closed_trades:
-        if trade.symbol not in symbol_performance:
-            symbol_performance[trade.symbol] = {
-                'trades': 0,
-                'wins': 0,
-                'total_pnl': 0
-            }
-
-        symbol_performance[trade.symbol]['trades'] += 1
-        symbol_performance[trade.symbol]['total_pnl'] += trade.pnl
-        if trade.pnl > 0:
-            symbol_performance[trade.symbol]['wins'] += 1
-
-    # Add win rates
-    for symbol in symbol_performance:
-        perf = symbol_performance[symbol]
-        perf['win_rate'] = (perf['wins'] / perf['trades'] * 100) if perf['trades'] > 0 else 0
-
-    # Exit reason analysis
-    exit_reasons = {}
-    for trade in closed_trades:
-        reason = trade.exit_reason
-        if reason not in exit_reasons:
-            exit_reasons[reason] = {'count': 0, 'total_pnl': 0}
-
-        exit_reasons[reason]['count'] += 1
-        exit_reasons[reason]['total_pnl'] += trade.pnl
+    expectancy = (avg_win * winners_count - avg_loss * losers_count) / total_trades if total_trades > 0 else 0
 
     return {
         "overall": {
             "total_trades": total_trades,
-            "winning_trades": len(winners),
-            "losing_trades": len(losers),
+            "winning_trades": winners_count,
+            "losing_trades": losers_count,
             "win_rate": win_rate,
             "avg_win": avg_win,
             "avg_loss": avg_loss,
             "profit_factor": profit_factor,
             "expectancy": expectancy,
-            "total_pnl": sum(t.pnl for t in closed_trades)
+            "total_pnl": summary['total_pnl']
         },
-        "by_symbol": symbol_performance,
-        "by_exit_reason": exit_reasons,
+        "by_symbol": data_service.get_symbol_performance(limit=500),
+        "by_exit_reason": data_service.get_exit_reason_performance(limit=500),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -309,7 +375,7 @@ async def get_performance_analysis():
 # ========== DIAGNOSTICS ==========
 
 @app.get("/api/diagnostics/verify-orders")
-async def verify_order_closure():
+def verify_order_closure():
     """Verify all orders are properly closed"""
     unclosed = data_service.get_unclosed_orders()
 
@@ -323,7 +389,7 @@ async def verify_order_closure():
 
 
 @app.get("/api/diagnostics/database-health")
-async def check_database_health():
+def check_database_health():
     """Check database connectivity and health"""
     status = data_service.get_system_status()
 
@@ -374,12 +440,16 @@ async def startup_event():
     """Application startup"""
     logger.info("VELOX Analytics Dashboard API starting...")
     logger.info("Data service initialized")
+    app.state.snapshot_task = asyncio.create_task(_snapshot_refresher())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info("VELOX Analytics Dashboard API shutting down...")
+    snapshot_task = getattr(app.state, 'snapshot_task', None)
+    if snapshot_task:
+        snapshot_task.cancel()
     data_service.close()
 
 
@@ -1,13 +1,23 @@
 """
 WebSocket server for real-time dashboard updates
 Streams position updates, price changes, and trade events
+
+Run with ``python -m src.dashboard.api.websocket_server``, or through the
+uvicorn CLI using the app factory, e.g.
+``uvicorn src.dashboard.api.websocket_server:create_app --factory --workers 4``
 """
+import argparse
 import asyncio
-import json
+import functools
 import logging
-from typing import Dict, Set, Any
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set, Any, Callable, Optional
 from datetime import datetime
-from dataclasses import asdict
+from decimal import Decimal
+import orjson
 import redis.asyncio as aioredis
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,84 +25,314 @@ import uvicorn
 
 from .data_service import DataService
 
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = "uvloop"
+except ImportError:  # uvloop is not available on Windows
+    UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "h11"
+
 logger = logging.getLogger(__name__)
 
+# A client that cannot take a frame within this window is dropped
+SEND_TIMEOUT_SECONDS = 5.0
+# Close codes: 1008 policy violation (send timed out), 1001 going away
+# (send failed), 1013 try again later (queue overflow)
+WS_CLOSE_SEND_TIMEOUT = 1008
+WS_CLOSE_SEND_ERROR = 1001
+WS_CLOSE_SHED = 1013
+# Frames buffered per client before it is considered too slow and shed
+OUTBOUND_QUEUE_SIZE = 256
+# Unchanged periodic snapshots are still re-sent this often as a heartbeat
+SNAPSHOT_FORCE_INTERVAL_SECONDS = 30.0
+# Threads reserved for blocking DataService queries
+DB_EXECUTOR_WORKERS = 4
+# Price updates per symbol are coalesced into one frame over this window
+PRICE_BATCH_INTERVAL_SECONDS = 0.05
+# Server settings for uvicorn. Per-message deflate is off because shared
+# frames are compressed once per broadcast for clients that opt in (Frame)
+UVICORN_OPTIONS = {
+    "loop": UVICORN_LOOP,
+    "http": UVICORN_HTTP,
+    "ws": "websockets",
+    "ws_per_message_deflate": False,
+}
+
+REDIS_URL = "redis://localhost:6379"
+# Shared by the pub/sub listener and any other Redis use in the server
+REDIS_POOL_SIZE = 16
+
+# Redis channels whose JSON payload is forwarded verbatim inside an envelope
+REDIS_ENVELOPES = {
+    b"position_updates": '{"type":"position_update","data":',
+    b"trade_closed": '{"type":"trade_closed","data":',
+    b"trailing_sl_updates": '{"type":"trailing_sl_update","data":',
+}
+
+# Clients offering this subprotocol receive zlib-compressed binary frames
+DEFLATE_SUBPROTOCOL = "velox.deflate"
+PRECOMPRESSED_TAG = b"\x01"
+COMPRESSION_LEVEL = 1
+
+
+# Wall-clock ISO timestamp reused by every caller within this window
+TIMESTAMP_REFRESH_SECONDS = 0.1
+_timestamp_cache = (0.0, "")
+
+
+def cached_timestamp() -> str:
+    """Current ISO timestamp, recomputed at most every TIMESTAMP_REFRESH_SECONDS"""
+    global _timestamp_cache
+    now = time.monotonic()
+    if now - _timestamp_cache[0] >= TIMESTAMP_REFRESH_SECONDS:
+        _timestamp_cache = (now, datetime.now().isoformat())
+    return _timestamp_cache[1]
+
+
+# Converters for the few payload types orjson cannot serialize itself,
+# looked up by exact type; register more with register_encoder()
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    set: list,
+    frozenset: list,
+    deque: list,
+    Decimal: float,
+}
+
+
+def register_encoder(cls: type, encoder: Callable[[Any], Any]):
+    """Teach encode_message() how to serialize another type"""
+    _ENCODERS[cls] = encoder
+
+
+def _encode_default(obj: Any) -> Any:
+    """orjson default hook backed by the encoder registry"""
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return encoder(obj)
+
+
+def encode_message(message: Any) -> str:
+    """Serialize a message for a WebSocket text frame.
+
+    orjson serializes the DataService dataclasses natively, so payloads
+    carry dataclass instances directly instead of ``asdict`` copies.
+    Numpy values are handled natively too; anything else goes through
+    the encoder registry.
+    """
+    return orjson.dumps(
+        message, default=_encode_default, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+class Frame:
+    """An encoded message shared by every recipient
+
+    The compressed form is built on first use, so a broadcast is
+    compressed at most once no matter how many clients negotiated
+    DEFLATE_SUBPROTOCOL.
+    """
+
+    __slots__ = ("text", "_compressed")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._compressed: Optional[bytes] = None
+
+    @property
+    def compressed(self) -> bytes:
+        if self._compressed is None:
+            self._compressed = PRECOMPRESSED_TAG + zlib.compress(self.text.encode(), COMPRESSION_LEVEL)
+        return self._compressed
+
 
 class ConnectionManager:
-    """Manages WebSocket connections and broadcasts"""
+    """Manages WebSocket connections and broadcasts
+
+    Each client has a bounded outbound queue drained by its own writer
+    task, so publishers only enqueue and never wait on a slow peer.
+    """
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
         self.symbol_subscriptions: Dict[str, Set[WebSocket]] = {}
+        self._outbound: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Symbol fanout targets: the subscribers' outbound queues
+        self._symbol_queues: Dict[str, List[asyncio.Queue]] = {}
+        self._queue_owners: Dict[asyncio.Queue, WebSocket] = {}
+        # Reverse index so disconnect only touches this client's symbols
+        self._ws_symbols: Dict[WebSocket, Set[str]] = {}
+        # In-flight close handshakes, referenced so they are not collected mid-run
+        self._close_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
-        await websocket.accept()
+        compressed = DEFLATE_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+        await websocket.accept(subprotocol=DEFLATE_SUBPROTOCOL if compressed else None)
+        queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._outbound[websocket] = queue
+        self._queue_owners[queue] = websocket
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue, compressed))
         self.active_connections.add(websocket)
         logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
+        if websocket not in self.active_connections:
+            return
+
         self.active_connections.discard(websocket)
+        queue = self._outbound.pop(websocket, None)
+        self._queue_owners.pop(queue, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
         # Remove from symbol subscriptions
-        for subscribers in self.symbol_subscriptions.values():
-            subscribers.discard(websocket)
+        for symbol in self._ws_symbols.pop(websocket, ()):
+            self.symbol_subscriptions[symbol].discard(websocket)
+            self._symbol_queues[symbol].remove(queue)
 
         logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
 
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue, compressed: bool):
+        """Drain a client's outbound queue onto its socket"""
+        try:
+            while True:
+                frame = await queue.get()
+                if compressed:
+                    send = websocket.send_bytes(frame.compressed)
+                else:
+                    send = websocket.send_text(frame.text)
+                await asyncio.wait_for(send, timeout=SEND_TIMEOUT_SECONDS)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            logger.warning(f"Send to client timed out after {SEND_TIMEOUT_SECONDS}s")
+            self.disconnect(websocket)
+            self._close(websocket, WS_CLOSE_SEND_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            self.disconnect(websocket)
+            self._close(websocket, WS_CLOSE_SEND_ERROR)
+
+    def _enqueue(self, websocket: WebSocket, frame: Frame):
+        """Queue a frame for a client, shedding the client if its queue is full"""
+        queue = self._outbound.get(websocket)
+        if queue is None:
+            return
+
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._shed(websocket)
+
+    def _shed(self, websocket: WebSocket):
+        """Drop a client that has fallen too far behind"""
+        logger.warning(f"Client outbound queue full ({OUTBOUND_QUEUE_SIZE} frames), disconnecting")
+        self.disconnect(websocket)
+        self._close(websocket, WS_CLOSE_SHED)
+
+    def _close(self, websocket: WebSocket, code: int):
+        """Send a close frame in the background, keeping a reference to the task"""
+        task = asyncio.create_task(self._close_socket(websocket, code))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close_socket(websocket: WebSocket, code: int):
+        """Close a dropped client's socket; a dead peer may never answer"""
+        try:
+            await asyncio.wait_for(websocket.close(code=code), timeout=SEND_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.debug(f"Closing dropped client failed: {e}")
+
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to specific client"""
         try:
-            await websocket.send_json(message)
+            self._enqueue(websocket, Frame(encode_message(message)))
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        disconnected = set()
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.add(connection)
+        # Encode once; every client receives the same frame
+        await self.broadcast_frame(Frame(encode_message(message)))
 
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+    async def broadcast_frame(self, frame: Frame):
+        """Broadcast an already encoded frame to all connected clients"""
+        self._fan_out(self._outbound.values(), frame)
 
     async def broadcast_to_symbol_subscribers(self, symbol: str, message: dict):
         """Broadcast message to clients subscribed to a symbol"""
-        if symbol not in self.symbol_subscriptions:
-            return
+        if self.has_symbol_subscribers(symbol):
+            await self.broadcast_frame_to_symbol(symbol, Frame(encode_message(message)))
 
-        disconnected = set()
+    async def broadcast_frame_to_symbol(self, symbol: str, frame: Frame):
+        """Broadcast an already encoded frame to clients subscribed to a symbol"""
+        queues = self._symbol_queues.get(symbol)
+        if queues:
+            self._fan_out(queues, frame)
 
-        for connection in self.symbol_subscriptions[symbol]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to symbol subscriber: {e}")
-                disconnected.add(connection)
+    def _fan_out(self, queues: Iterable[asyncio.Queue], frame: Frame):
+        """Enqueue a frame on each queue in one pass over the live collection
+
+        Overflowing clients are only collected during the pass and shed
+        afterwards, so the common case copies nothing.
+        """
+        overflowed = None
 
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.symbol_subscriptions[symbol].discard(connection)
+        for queue in queues:
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                if overflowed is None:
+                    overflowed = []
+                overflowed.append(queue)
+
+        if overflowed:
+            for queue in overflowed:
+                websocket = self._queue_owners.get(queue)
+                if websocket is not None:
+                    self._shed(websocket)
+
+    def has_symbol_subscribers(self, symbol: str) -> bool:
+        """Check whether any client is subscribed to a symbol"""
+        return bool(self._symbol_queues.get(symbol))
 
     def subscribe_to_symbol(self, symbol: str, websocket: WebSocket):
         """Subscribe client to symbol updates"""
+        queue = self._outbound.get(websocket)
+        if queue is None:
+            return
+
         if symbol not in self.symbol_subscriptions:
             self.symbol_subscriptions[symbol] = set()
+            self._symbol_queues[symbol] = []
 
-        self.symbol_subscriptions[symbol].add(websocket)
+        if websocket not in self.symbol_subscriptions[symbol]:
+            self.symbol_subscriptions[symbol].add(websocket)
+            self._symbol_queues[symbol].append(queue)
+            self._ws_symbols.setdefault(websocket, set()).add(symbol)
         logger.info(f"Client subscribed to {symbol}")
 
     def unsubscribe_from_symbol(self, symbol: str, websocket: WebSocket):
         """Unsubscribe client from symbol updates"""
-        if symbol in self.symbol_subscriptions:
-            self.symbol_subscriptions[symbol].discard(websocket)
+        queue = self._outbound.get(websocket)
+        if queue is None:
+            return  # Already disconnected (shed, or its writer gave up)
+
+        subscribers = self.symbol_subscriptions.get(symbol)
+        if subscribers and websocket in subscribers:
+            subscribers.discard(websocket)
+            self._symbol_queues[symbol].remove(queue)
+            self._ws_symbols[websocket].discard(symbol)
 
 
 class DashboardWebSocketServer:
@@ -102,9 +342,21 @@ class DashboardWebSocketServer:
         self.app = FastAPI(title="VELOX Dashboard WebSocket API")
         self.data_service = data_service
         self.manager = ConnectionManager()
+        self.redis_pool = None
         self.redis_client = None
         self.pubsub = None
         self.is_running = False
+        # Price updates waiting for the next batch flush, per symbol
+        self._pending_prices: Dict[str, List[str]] = {}
+        self._price_flush_task: Optional[asyncio.Task] = None
+        # Periodic snapshot fingerprints: key -> (hash, last broadcast time)
+        self._snapshot_state: Dict[str, tuple] = {}
+        # DataService is synchronous; keep its SQLite/Influx/Redis calls off the
+        # event loop on a pool separate from the loop's default executor
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=DB_EXECUTOR_WORKERS,
+            thread_name_prefix="ws-data"
+        )
 
         # Configure CORS
         self.app.add_middleware(
@@ -120,62 +372,69 @@ class DashboardWebSocketServer:
 
     def _setup_routes(self):
         """Setup WebSocket and HTTP routes"""
+        self.app.add_api_websocket_route("/ws", self.websocket_endpoint)
+        self.app.add_api_route("/health", self.health_check, methods=["GET"])
 
-        @self.app.websocket("/ws")
-        async def websocket_endpoint(websocket: WebSocket):
-            """Main WebSocket endpoint"""
-            await self.manager.connect(websocket)
+    async def websocket_endpoint(self, websocket: WebSocket):
+        """Main WebSocket endpoint"""
+        await self.manager.connect(websocket)
 
-            try:
-                # Send initial data
-                await self._send_initial_data(websocket)
+        try:
+            # Send initial data
+            await self._send_initial_data(websocket)
 
-                # Listen for client messages
-                while True:
-                    data = await websocket.receive_json()
-                    await self._handle_client_message(websocket, data)
+            # Listen for client messages
+            while True:
+                data = orjson.loads(await websocket.receive_text())
+                await self._handle_client_message(websocket, data)
 
-            except WebSocketDisconnect:
-                self.manager.disconnect(websocket)
-            except Exception as e:
-                logger.error(f"WebSocket error: {e}")
-                self.manager.disconnect(websocket)
-
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint"""
-            return {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "connections": len(self.manager.active_connections)
-            }
+        except WebSocketDisconnect:
+            self.manager.disconnect(websocket)
+        except Exception as e:
+            logger.error(f"WebSocket error: {e}")
+            self.manager.disconnect(websocket)
+
+    async def health_check(self):
+        """Health check endpoint"""
+        return {
+            "status": "healthy",
+            "timestamp": cached_timestamp(),
+            "connections": len(self.manager.active_connections)
+        }
+
+    async def _query(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking DataService call on the dedicated executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._db_executor, functools.partial(func, *args, **kwargs)
+        )
 
     async def _send_initial_data(self, websocket: WebSocket):
         """Send initial dashboard data to newly connected client"""
         try:
             # Get all open positions
-            positions = self.data_service.get_open_positions()
+            positions = await self._query(self.data_service.get_open_positions)
             await self.manager.send_personal_message({
                 "type": "initial_positions",
-                "data": [asdict(pos) for pos in positions]
+                "data": positions
             }, websocket)
 
             # Get recent closed trades
-            closed_trades = self.data_service.get_closed_trades(limit=50)
+            closed_trades = await self._query(self.data_service.get_closed_trades, limit=50)
             await self.manager.send_personal_message({
                 "type": "initial_closed_trades",
-                "data": [asdict(trade) for trade in closed_trades]
+                "data": closed_trades
             }, websocket)
 
             # Get strategy metrics
-            metrics = self.data_service.get_all_strategy_metrics()
+            metrics = await self._query(self.data_service.get_all_strategy_metrics)
             await self.manager.send_personal_message({
                 "type": "initial_strategy_metrics",
-                "data": {k: asdict(v) for k, v in metrics.items()}
+                "data": metrics
             }, websocket)
 
             # Get system status
-            status = self.data_service.get_system_status()
+            status = await self._query(self.data_service.get_system_status)
             await self.manager.send_personal_message({
                 "type": "system_status",
                 "data": status
@@ -194,11 +453,11 @@ class DashboardWebSocketServer:
                 self.manager.subscribe_to_symbol(symbol, websocket)
 
                 # Send price history for the symbol
-                price_history = self.data_service.get_price_history(symbol, hours=1)
+                price_history = await self._query(self.data_service.get_price_history, symbol, hours=1)
                 await self.manager.send_personal_message({
                     "type": "price_history",
                     "symbol": symbol,
-                    "data": [asdict(p) for p in price_history]
+                    "data": price_history
                 }, websocket)
 
         elif msg_type == "unsubscribe_symbol":
@@ -209,26 +468,22 @@ class DashboardWebSocketServer:
         elif msg_type == "get_position":
             symbol = message.get("symbol")
             if symbol:
-                position = self.data_service.get_position_by_symbol(symbol)
+                position = await self._query(self.data_service.get_position_by_symbol, symbol)
                 await self.manager.send_personal_message({
                     "type": "position_update",
                     "symbol": symbol,
-                    "data": asdict(position) if position else None
+                    "data": position
                 }, websocket)
 
         elif msg_type == "ping":
             await self.manager.send_personal_message({
                 "type": "pong",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             }, websocket)
 
     async def _redis_listener(self):
         """Listen to Redis pub/sub for real-time updates"""
         try:
-            self.redis_client = await aioredis.from_url(
-                "redis://localhost:6379",
-                decode_responses=True
-            )
             self.pubsub = self.redis_client.pubsub()
 
             # Subscribe to relevant channels
@@ -249,69 +504,105 @@ class DashboardWebSocketServer:
             logger.error(f"Redis listener error: {e}")
         finally:
             if self.pubsub:
-                await self.pubsub.unsubscribe()
-            if self.redis_client:
-                await self.redis_client.close()
+                # Returns the pub/sub connection to the shared pool
+                await self.pubsub.reset()
 
     async def _handle_redis_message(self, message: dict):
         """Handle messages from Redis pub/sub"""
+        if not self.manager.active_connections:
+            return
+
         try:
             channel = message["channel"]
-            data = json.loads(message["data"])
-
-            if channel == "position_updates":
-                # Broadcast position update
-                await self.manager.broadcast({
-                    "type": "position_update",
-                    "data": data
-                })
-
-            elif channel == "trade_closed":
-                # Broadcast trade closure
-                await self.manager.broadcast({
-                    "type": "trade_closed",
-                    "data": data
-                })
-
-            elif channel == "price_updates":
-                # Broadcast to symbol subscribers
-                symbol = data.get("symbol")
-                if symbol:
-                    await self.manager.broadcast_to_symbol_subscribers(symbol, {
-                        "type": "price_update",
-                        "symbol": symbol,
-                        "data": data
-                    })
-
-            elif channel == "trailing_sl_updates":
-                # Broadcast trailing SL update
-                await self.manager.broadcast({
-                    "type": "trailing_sl_update",
-                    "data": data
-                })
+            raw = message["data"].decode()
+
+            # Position updates, trade closures and trailing SL updates are
+            # already JSON from RedisPubSubPublisher: wrap, don't re-encode
+            envelope = REDIS_ENVELOPES.get(channel)
+            if envelope is not None:
+                await self.manager.broadcast_frame(Frame("".join((envelope, raw, "}"))))
+
+            elif channel == b"price_updates":
+                # Queue for the next batch to symbol subscribers
+                symbol = orjson.loads(raw).get("symbol")
+                if symbol and self.manager.has_symbol_subscribers(symbol):
+                    self._pending_prices.setdefault(symbol, []).append(raw)
+                    if self._price_flush_task is None:
+                        self._price_flush_task = asyncio.create_task(self._flush_price_batches())
 
         except Exception as e:
             logger.error(f"Error handling Redis message: {e}")
 
+    def _changed_snapshot(self, key: str, data: Any) -> Optional[str]:
+        """Encode a periodic snapshot, returning None if it is unchanged
+
+        Identical snapshots are suppressed, except that one is let through
+        every SNAPSHOT_FORCE_INTERVAL_SECONDS so clients still see a heartbeat.
+        The encoded JSON is returned so the broadcast can splice it into its
+        frame instead of serializing the data a second time.
+        """
+        encoded = encode_message(data)
+        digest = hash(encoded)
+        now = time.monotonic()
+        previous = self._snapshot_state.get(key)
+
+        if previous and previous[0] == digest and now - previous[1] < SNAPSHOT_FORCE_INTERVAL_SECONDS:
+            return None
+
+        self._snapshot_state[key] = (digest, now)
+        return encoded
+
+    async def _flush_price_batches(self):
+        """Send the price updates collected over one batch window"""
+        try:
+            await asyncio.sleep(PRICE_BATCH_INTERVAL_SECONDS)
+            pending, self._pending_prices = self._pending_prices, {}
+            for symbol, updates in pending.items():
+                # Raw update payloads are spliced into the batch as-is
+                frame = Frame("".join((
+                    '{"type":"price_batch","symbol":', encode_message(symbol),
+                    ',"data":[', ",".join(updates), "]}"
+                )))
+                await self.manager.broadcast_frame_to_symbol(symbol, frame)
+        except Exception as e:
+            logger.error(f"Error flushing price batches: {e}")
+        finally:
+            self._price_flush_task = None
+
     async def _periodic_updates(self):
         """Send periodic updates to all clients"""
         while self.is_running:
             try:
+                # Nobody is watching: skip the queries and encoding entirely
+                if not self.manager.active_connections:
+                    await asyncio.sleep(1)
+                    continue
+
                 # Update positions every 1 second
-                positions = self.data_service.get_open_positions()
-                await self.manager.broadcast({
-                    "type": "positions_snapshot",
-                    "data": [asdict(pos) for pos in positions],
-                    "timestamp": datetime.now().isoformat()
-                })
+                positions = await self._query(self.data_service.get_open_positions)
+                encoded = self._changed_snapshot("positions", positions)
+                if encoded is not None:
+                    await self.manager.broadcast_frame(Frame("".join((
+                        '{"type":"positions_snapshot","data":', encoded,
+                        ',"timestamp":', encode_message(cached_timestamp()), "}"
+                    ))))
 
                 # Update system status every 5 seconds
                 await asyncio.sleep(5)
-                status = self.data_service.get_system_status()
-                await self.manager.broadcast({
-                    "type": "system_status",
-                    "data": status
-                })
+                if self.manager.active_connections:
+                    status = await self._query(self.data_service.get_system_status)
+                    fingerprint = {k: v for k, v in status.items() if k != "timestamp"}
+                    encoded = self._changed_snapshot("system_status", fingerprint)
+                    if encoded is not None:
+                        if "timestamp" in status:
+                            # Put the timestamp back by splicing, not by re-encoding status
+                            encoded = "".join((
+                                encoded[:-1], "," if fingerprint else "",
+                                '"timestamp":', encode_message(status["timestamp"]), "}"
+                            ))
+                        await self.manager.broadcast_frame(Frame(
+                            '{"type":"system_status","data":' + encoded + "}"
+                        ))
 
                 await asyncio.sleep(1)
 
@@ -323,6 +614,15 @@ class DashboardWebSocketServer:
         """Start background tasks"""
         self.is_running = True
 
+        # One pool for the server's lifetime; payloads stay as bytes so they
+        # can be forwarded without re-encoding
+        self.redis_pool = aioredis.ConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_POOL_SIZE,
+            decode_responses=False
+        )
+        self.redis_client = aioredis.Redis(connection_pool=self.redis_pool)
+
         # Start Redis listener
         asyncio.create_task(self._redis_listener())
 
@@ -331,9 +631,8 @@ class DashboardWebSocketServer:
 
         logger.info("Background tasks started")
 
-    def run(self, host: str = "0.0.0.0", port: int = 8765):
-        """Run the WebSocket server"""
-        logger.info(f"Starting WebSocket server on {host}:{port}")
+    def _register_lifecycle(self):
+        """Hook background tasks and cleanup into the app's startup/shutdown"""
 
         @self.app.on_event("startup")
         async def startup():
@@ -344,11 +643,51 @@ class DashboardWebSocketServer:
             self.is_running = False
             if self.redis_client:
                 await self.redis_client.close()
+            if self.redis_pool:
+                await self.redis_pool.disconnect()
+            self._db_executor.shutdown(wait=False)
+
+    def run(self, host: str = "0.0.0.0", port: int = 8765, workers: int = 1):
+        """Run the WebSocket server
+
+        With workers > 1 (opt-in), uvicorn forks that many processes sharing
+        the port, each building its own server through create_app(). Client
+        state is per worker: every worker holds its own subset of clients and
+        runs its own periodic DB/Redis polling loops, so polling load grows
+        with the worker count, and only events published through Redis reach
+        the clients of every worker.
+        """
+        logger.info(f"Starting WebSocket server on {host}:{port} ({workers} worker(s))")
+
+        if workers > 1:
+            uvicorn.run(
+                f"{__spec__.name}:create_app",
+                factory=True,
+                host=host,
+                port=port,
+                workers=workers,
+                **UVICORN_OPTIONS
+            )
+            return
 
-        uvicorn.run(self.app, host=host, port=port)
+        self._register_lifecycle()
+        uvicorn.run(self.app, host=host, port=port, **UVICORN_OPTIONS)
 
 
+def create_app() -> FastAPI:
+    """Build a fully wired WebSocket app; used as the uvicorn worker factory"""
+    server = DashboardWebSocketServer(DataService())
+    server._register_lifecycle()
+    return server.app
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VELOX dashboard WebSocket server")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="worker processes (default 1); client state and DB polling are per worker"
+    )
+    args = parser.parse_args()
+
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
@@ -360,4 +699,4 @@ if __name__ == "__main__":
 
     # Create and run WebSocket server
     server = DashboardWebSocketServer(data_service)
-    server.run()
+    server.run(workers=args.workers)
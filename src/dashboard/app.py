@@ -2,18 +2,50 @@
 VELOX Dashboard - Simple Flask Web Interface
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template
+from flask.json.provider import DefaultJSONProvider
+from collections import deque
 from datetime import datetime
 import json
 from pathlib import Path
 import sys
+import orjson
 
 # Add src to path
 src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    # Converters for types orjson lacks, by exact type; others fall back
+    # to Flask's default handling
+    encoders = {
+        deque: list,
+        set: list,
+    }
+
+    @staticmethod
+    def default(o):
+        encoder = ORJSONProvider.encoders.get(type(o))
+        if encoder is not None:
+            return encoder(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Global state (will be updated by the system)
 dashboard_state = {
@@ -31,10 +63,33 @@ dashboard_state = {
         'pnl_pct': 0,
         'total_value': 100000
     },
-    'recent_logs': [],
+    'recent_logs': deque(maxlen=50),
     'last_update': None
 }
 
+# Encoded API responses as {endpoint: (state_version, body)}. Bumping the
+# version in update_state()/add_log() makes the next request re-encode.
+_state_version = 0
+_response_cache = {}
+
+
+def _touch_state():
+    """Record a state change so cached responses are rebuilt."""
+    global _state_version
+    dashboard_state['last_update'] = datetime.now().isoformat()
+    _state_version += 1
+
+
+def _cached_json(key, build):
+    """Return a JSON response, re-encoding only if the state changed."""
+    version = _state_version
+    cached = _response_cache.get(key)
+    if cached is None or cached[0] != version:
+        body = orjson.dumps(build(), default=app.json.default, option=orjson.OPT_NON_STR_KEYS)
+        cached = (version, body)
+        _response_cache[key] = cached
+    return Response(cached[1], mimetype='application/json')
+
 
 @app.route('/')
 def index():
@@ -45,14 +100,13 @@ def index():
 @app.route('/api/status')
 def get_status():
     """Get current system status."""
-    dashboard_state['last_update'] = datetime.now().isoformat()
-    return jsonify(dashboard_state)
+    return _cached_json('status', lambda: dashboard_state)
 
 
 @app.route('/api/strategies')
 def get_strategies():
     """Get strategy information."""
-    return jsonify({
+    return _cached_json('strategies', lambda: {
         'strategies': dashboard_state.get('strategies', []),
         'count': len(dashboard_state.get('strategies', []))
     })
@@ -61,7 +115,7 @@ def get_strategies():
 @app.route('/api/positions')
 def get_positions():
     """Get current positions."""
-    return jsonify({
+    return _cached_json('positions', lambda: {
         'positions': dashboard_state.get('positions', []),
         'count': len(dashboard_state.get('positions', []))
     })
@@ -70,12 +124,13 @@ def get_positions():
 @app.route('/api/account')
 def get_account():
     """Get account information."""
-    return jsonify(dashboard_state.get('account', {}))
+    return _cached_json('account', lambda: dashboard_state.get('account', {}))
 
 
 def update_state(key, value):
     """Update dashboard state."""
     dashboard_state[key] = value
+    _touch_state()
 
 
 def add_log(message, level='INFO'):
@@ -86,12 +141,13 @@ def add_log(message, level='INFO'):
         'message': message
     }
     
-    # Keep only last 50 logs
-    if 'recent_logs' not in dashboard_state:
-        dashboard_state['recent_logs'] = []
+    # Keep only last 50 logs, newest first
+    logs = dashboard_state.get('recent_logs')
+    if not isinstance(logs, deque):
+        logs = dashboard_state['recent_logs'] = deque(logs or (), maxlen=50)
     
-    dashboard_state['recent_logs'].insert(0, log_entry)
-    dashboard_state['recent_logs'] = dashboard_state['recent_logs'][:50]
+    logs.appendleft(log_entry)
+    _touch_state()
 
 
 def run_dashboard(host='0.0.0.0', port=5000, debug=False):
@@ -3,6 +3,6 @@
 from .redis_manager import RedisManager
 from .influx_manager import InfluxManager
 from .sqlite_manager import SQLiteManager
-from .data_manager import DataManager
+from .data_manager import DataManager, get_data_manager
 
-__all__ = ['RedisManager', 'InfluxDB', 'SQLiteManager', 'DataManager']
+__all__ = ['RedisManager', 'InfluxDB', 'SQLiteManager', 'DataManager', 'get_data_manager']
@@ -8,12 +8,25 @@ Provides a single interface for all data operations.
 from .redis_manager import RedisManager
 from .influx_manager import InfluxManager
 from .sqlite_manager import SQLiteManager
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Optional
 import logging
+import threading
+import time
 
 log = logging.getLogger(__name__)
 
+TRADE_CACHE_SIZE = 1024  # Most recently read trades kept in memory
+STRATEGY_STATS_TTL_SECONDS = 60.0
+HEALTH_CACHE_TTL_SECONDS = 5.0  # health_check/get_system_info refresh in the background after this
+ERROR_TRACEBACK_INTERVAL_SECONDS = 10.0  # Per operation; other failures are only counted
+
+# Unpacks the fields every signal dict carries in a single call
+_signal_fields = itemgetter('strategy_id', 'symbol', 'action', 'price', 'quantity')
+
 
 class DataManager:
     """
@@ -40,6 +53,25 @@ class DataManager:
         self.influx = InfluxManager()
         self.sqlite = SQLiteManager()
         
+        # Open positions held in-process; Redis keeps the shared/recovery copy
+        self._positions: Dict[tuple, dict] = {}   # (strategy_id, symbol) -> position
+        self._trade_positions: Dict[str, tuple] = {}  # trade_id -> (strategy_id, symbol)
+        
+        # Read-through caches over SQLite, invalidated by open/close_position
+        self._cache_lock = threading.Lock()
+        self._trade_cache = OrderedDict()       # trade_id -> trade (LRU)
+        self._open_positions_cache = {}         # strategy_id -> open trades
+        self._strategy_stats_cache = {}         # (strategy_id, days) -> (expires_at, stats)
+        
+        # Cached health/system probes: name -> (checked_at, value)
+        self._probe_lock = threading.Lock()
+        self._probes = {}
+        self._probes_refreshing = set()
+        
+        # Failures per logging operation; tracebacks are rate-limited
+        self._error_counts = Counter()
+        self._error_logged_at = {}
+        
         # Check health
         redis_ok = self.redis.health_check()
         influx_ok = self.influx.health_check()
@@ -51,6 +83,53 @@ class DataManager:
             f"SQLite=✓"
         )
     
+    def _log_error(self, operation: str, error: Exception):
+        """
+        Count a failed operation and log it, with a traceback at most once per
+        ERROR_TRACEBACK_INTERVAL_SECONDS for that operation.
+        
+        Args:
+            operation: What was being done, e.g. "logging candle"
+            error: The caught exception
+        """
+        self._error_counts[operation] += 1
+        now = time.monotonic()
+        last = self._error_logged_at.get(operation)
+        if last is not None and now - last < ERROR_TRACEBACK_INTERVAL_SECONDS:
+            return
+        self._error_logged_at[operation] = now
+        log.error("Error %s: %s (%d so far)", operation, error,
+                  self._error_counts[operation], exc_info=error)
+    
+    def _invalidate_trade(self, trade_id: str, strategy_id: str):
+        """Drop cached reads affected by a trade opening or closing."""
+        with self._cache_lock:
+            self._trade_cache.pop(trade_id, None)
+            self._open_positions_cache.clear()
+            for key in [k for k in self._strategy_stats_cache if k[0] == strategy_id]:
+                del self._strategy_stats_cache[key]
+    
+    @contextmanager
+    def _redis_pipeline(self):
+        """
+        Coalesce the Redis writes made inside the block into one round-trip.
+        
+        Yields a non-transactional pipeline (None when Redis is down, in which
+        case RedisManager calls are no-ops) and executes it once on exit.
+        """
+        pipe = self.redis.pipeline()
+        if pipe is None:
+            yield None
+            return
+        try:
+            yield pipe
+            try:
+                pipe.execute()
+            except Exception as e:
+                log.error(f"Redis pipeline error: {e}")
+        finally:
+            pipe.reset()
+    
     # ==================== Position Operations ====================
     
     def open_position(self, trade_id: str, strategy_id: str, symbol: str,
@@ -68,40 +147,42 @@ class DataManager:
             timestamp: Entry timestamp
             signal_conditions: Entry signal conditions
         """
-        # SQLite: Store trade metadata
+        # SQLite: Store trade metadata with its entry conditions (one INSERT)
         self.sqlite.insert_trade(
             trade_id, strategy_id, symbol, 'BUY',
-            timestamp, entry_price, quantity
+            timestamp, entry_price, quantity,
+            entry_conditions=signal_conditions
         )
+        self._invalidate_trade(trade_id, strategy_id)
         
-        # SQLite: Store signal conditions
-        if signal_conditions:
-            self.sqlite.insert_signal_conditions(
-                trade_id, 'entry', signal_conditions, timestamp
-            )
+        # InfluxDB: Write trade execution
+        self.influx.write_trade(
+            strategy_id, symbol, 'BUY',
+            entry_price, quantity, timestamp=timestamp
+        )
         
-        # Redis: Cache position
+        # Redis: Cache position (the only blocking round-trip; the SQLite and
+        # InfluxDB writes above are already in flight on their writer threads)
         position_data = {
             'trade_id': trade_id,
             'strategy_id': strategy_id,
             'symbol': symbol,
             'entry_price': entry_price,
             'quantity': quantity,
-            'entry_time': timestamp.isoformat()
+            'entry_time_ns': round(timestamp.timestamp() * 1_000_000) * 1000
         }
-        self.redis.set_position(strategy_id, symbol, position_data)
-        
-        # InfluxDB: Write trade execution
-        self.influx.write_trade(
-            strategy_id, symbol, 'BUY',
-            entry_price, quantity, timestamp=timestamp
-        )
+        self._positions[(strategy_id, symbol)] = position_data
+        self._trade_positions[trade_id] = (strategy_id, symbol)
+        with self._redis_pipeline() as pipe:
+            self.redis.set_position(strategy_id, symbol, position_data, pipe=pipe)
+            self.redis.add_strategy(strategy_id, pipe=pipe)
         
-        log.info(f"✓ Position opened: {trade_id} ({strategy_id} {symbol} @ {entry_price})")
+        log.info("✓ Position opened: %s (%s %s @ %s)", trade_id, strategy_id, symbol, entry_price)
     
     def close_position(self, trade_id: str, strategy_id: str, symbol: str,
                       exit_price: float, exit_time: datetime,
-                      pnl: float, pnl_pct: float, exit_reason: str):
+                      pnl: float, pnl_pct: float, exit_reason: str,
+                      quantity: int = None, signal_conditions: dict = None):
         """
         Close position across all systems.
         
@@ -114,26 +195,42 @@ class DataManager:
             pnl: Profit/Loss amount
             pnl_pct: Profit/Loss percentage
             exit_reason: Reason for exit
+            quantity: Position quantity (read from the cached position if omitted)
+            signal_conditions: Exit signal conditions
         """
+        position = self._positions.pop((strategy_id, symbol), None)
+        self._trade_positions.pop(trade_id, None)
+        if quantity is None:
+            if position is None:
+                position = self.redis.get_position(strategy_id, symbol)
+            if position and position.get('trade_id') == trade_id:
+                quantity = position['quantity']
+            else:
+                # Redis unavailable or entry expired: fall back to the trade row
+                trade = self.get_trade(trade_id)
+                quantity = trade['quantity'] if trade else None
+        
         # SQLite: Update trade with exit details
         self.sqlite.update_trade_exit(
             trade_id, exit_time, exit_price,
-            pnl, pnl_pct, exit_reason
+            pnl, pnl_pct, exit_reason,
+            exit_conditions=signal_conditions
         )
-        
-        # Redis: Remove position from cache
-        self.redis.delete_position(strategy_id, symbol)
+        self._invalidate_trade(trade_id, strategy_id)
         
         # InfluxDB: Write trade execution
-        trade = self.sqlite.get_trade(trade_id)
-        if trade:
+        if quantity is not None:
             self.influx.write_trade(
                 strategy_id, symbol, 'SELL',
-                exit_price, trade['quantity'],
+                exit_price, quantity,
                 pnl=pnl, timestamp=exit_time
             )
         
-        log.info(f"✓ Position closed: {trade_id} (P&L: ${pnl:.2f}, {pnl_pct:.2f}%)")
+        # Redis: Remove position from cache
+        with self._redis_pipeline() as pipe:
+            self.redis.delete_position(strategy_id, symbol, pipe=pipe)
+        
+        log.info("✓ Position closed: %s (P&L: $%.2f, %.2f%%)", trade_id, pnl, pnl_pct)
     
     def update_position_snapshot(self, strategy_id: str, symbol: str,
                                  current_price: float, quantity: int,
@@ -157,7 +254,8 @@ class DataManager:
     
     # ==================== Tick Data ====================
     
-    def process_tick(self, symbol: str, tick_data: dict, timestamp: datetime = None):
+    def process_tick(self, symbol: str, tick_data: dict, timestamp: datetime = None,
+                     indicators: dict = None):
         """
         Process incoming tick data.
         
@@ -165,12 +263,21 @@ class DataManager:
             symbol: Symbol name
             tick_data: Tick data dict
             timestamp: Tick timestamp
+            indicators: Indicators computed on this tick, cached in the same
+                Redis round-trip as the tick
         """
-        # Redis: Cache latest tick
-        self.redis.set_latest_tick(symbol, tick_data)
-        
-        # InfluxDB: Store tick history
+        # InfluxDB: Store tick history (buffered, returns immediately)
         self.influx.write_tick(symbol, tick_data, timestamp)
+        
+        if indicators is None:
+            # Redis: Cache latest tick
+            self.redis.set_latest_tick(symbol, tick_data)
+            return
+        
+        self.influx.write_indicators_multi(symbol, indicators, timestamp)
+        with self._redis_pipeline() as pipe:
+            self.redis.set_latest_tick(symbol, tick_data, pipe=pipe)
+            self.redis.set_indicators(symbol, indicators, pipe=pipe)
     
     def get_latest_tick(self, symbol: str) -> Optional[dict]:
         """Get latest tick from cache."""
@@ -184,15 +291,13 @@ class DataManager:
         
         Args:
             symbol: Symbol name
-            indicators: Dict of indicator values
+            indicators: Dict of indicator name -> float (None while not ready)
         """
+        # InfluxDB: Store for history as a single multi-field point (buffered)
+        self.influx.write_indicators_multi(symbol, indicators)
+        
         # Redis: Cache for fast access
         self.redis.set_indicators(symbol, indicators)
-        
-        # InfluxDB: Store for history
-        for indicator_type, value in indicators.items():
-            if isinstance(value, (int, float)):
-                self.influx.write_indicator(symbol, indicator_type, value)
     
     def get_indicators(self, symbol: str) -> Optional[dict]:
         """Get cached indicators."""
@@ -226,8 +331,19 @@ class DataManager:
         Returns:
             Statistics dict
         """
-        # Get from SQLite (trade metadata)
-        return self.sqlite.get_strategy_stats(strategy_id, days)
+        key = (strategy_id, days)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._strategy_stats_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        # Get from SQLite (trade metadata); cached for a short TTL since
+        # the date window moves even when no trade closes
+        stats = self.sqlite.get_strategy_stats(strategy_id, days)
+        with self._cache_lock:
+            self._strategy_stats_cache[key] = (now + STRATEGY_STATS_TTL_SECONDS, stats)
+        return stats
     
     # ==================== Trailing Stop Loss ====================
     
@@ -244,20 +360,21 @@ class DataManager:
             highest_price: Highest price since entry
             sl_type: Type of stop loss
         """
+        # InfluxDB: Record SL update
+        self.influx.write_sl_update(
+            strategy_id, symbol, trade_id,
+            current_sl, highest_price, sl_type
+        )
+        
         # Redis: Update SL state
         sl_data = {
             'current_sl': current_sl,
             'highest_price': highest_price,
             'sl_type': sl_type,
-            'updated_at': datetime.now().isoformat()
+            'updated_at_ns': time.time_ns()
         }
+        # A single command: a pipeline would only add buffering overhead
         self.redis.set_sl_state(trade_id, sl_data)
-        
-        # InfluxDB: Record SL update
-        self.influx.write_sl_update(
-            strategy_id, symbol, trade_id,
-            current_sl, highest_price, sl_type
-        )
     
     # ==================== Signal Logging (NEW - for trade verification) ====================
 
@@ -296,7 +413,28 @@ class DataManager:
             timestamp=timestamp
         )
 
-        log.debug(f"Signal logged: {strategy_id} {symbol} {action} @ {price} - {status}")
+        log.debug("Signal logged: %s %s %s @ %s - %s", strategy_id, symbol, action, price, status)
+
+    def log_signal_data(self, signal_data: dict, approved: bool, rejection_reason: str = None):
+        """
+        Log a signal given as a signal dict (approved or rejected).
+
+        Args:
+            signal_data: Signal dict with strategy_id, symbol, action, price, quantity
+                and optional reason, indicators and timestamp
+            approved: Whether signal was approved
+            rejection_reason: Reason for rejection (if rejected)
+        """
+        strategy_id, symbol, action, price, quantity = _signal_fields(signal_data)
+        get = signal_data.get
+        self.log_signal(
+            strategy_id, symbol, action, price, quantity,
+            reason=get('reason', ''),
+            approved=approved,
+            rejection_reason=rejection_reason,
+            indicators=get('indicators'),
+            timestamp=get('timestamp')
+        )
 
     def log_order_execution(self, strategy_id: str, symbol: str, action: str,
                            order_id: str, requested_price: float,
@@ -330,7 +468,7 @@ class DataManager:
             timestamp=timestamp
         )
 
-        log.debug(f"Order execution logged: {order_id} - Slippage: {slippage_pct:.4%}")
+        log.debug("Order execution logged: %s - Slippage: %.4f%%", order_id, slippage_pct * 100)
 
     def log_trade_complete(self, trade_id: str, strategy_id: str, symbol: str,
                           entry_price: float, exit_price: float, quantity: int,
@@ -381,9 +519,11 @@ class DataManager:
             timestamp=timestamp
         )
 
-        mfe_str = f"MFE: ${max_favorable_excursion:.2f}" if max_favorable_excursion else "MFE: N/A"
-        mae_str = f"MAE: ${max_adverse_excursion:.2f}" if max_adverse_excursion else "MAE: N/A"
-        log.info(f"Trade complete logged: {trade_id} - P&L: ${pnl:.2f} ({pnl_pct:.2%}) {mfe_str} {mae_str}")
+        if log.isEnabledFor(logging.INFO):
+            mfe_str = f"MFE: ${max_favorable_excursion:.2f}" if max_favorable_excursion else "MFE: N/A"
+            mae_str = f"MAE: ${max_adverse_excursion:.2f}" if max_adverse_excursion else "MAE: N/A"
+            log.info("Trade complete logged: %s - P&L: $%.2f (%.2f%%) %s %s",
+                     trade_id, pnl, pnl_pct * 100, mfe_str, mae_str)
 
     def log_strategy_health(self, strategy_id: str, strategy_type: str,
                            health_metrics: dict, timestamp: datetime = None):
@@ -404,23 +544,41 @@ class DataManager:
             timestamp=timestamp
         )
 
-        log.debug(f"Strategy health logged: {strategy_id} - "
-                 f"Positions: {health_metrics.get('open_positions_count', 0)}, "
-                 f"P&L: ${health_metrics.get('total_pnl', 0):.2f}")
+        log.debug("Strategy health logged: %s - Positions: %s, P&L: $%.2f",
+                  strategy_id, health_metrics.get('open_positions_count', 0),
+                  health_metrics.get('total_pnl', 0))
 
     # ==================== Queries ====================
 
     def get_open_positions(self, strategy_id: str = None) -> List[Dict]:
-        """Get all open positions."""
-        return self.sqlite.get_open_trades(strategy_id)
+        """Get all open positions (cached until the next open/close)."""
+        with self._cache_lock:
+            positions = self._open_positions_cache.get(strategy_id)
+        if positions is None:
+            positions = self.sqlite.get_open_trades(strategy_id)
+            with self._cache_lock:
+                self._open_positions_cache[strategy_id] = positions
+        return positions
     
     def get_closed_trades(self, strategy_id: str = None, limit: int = 100) -> List[Dict]:
         """Get closed trades."""
         return self.sqlite.get_closed_trades(strategy_id, limit)
     
     def get_trade(self, trade_id: str) -> Optional[Dict]:
-        """Get specific trade details."""
-        return self.sqlite.get_trade(trade_id)
+        """Get specific trade details (LRU-cached)."""
+        with self._cache_lock:
+            trade = self._trade_cache.get(trade_id)
+            if trade is not None:
+                self._trade_cache.move_to_end(trade_id)
+                return trade
+        
+        trade = self.sqlite.get_trade(trade_id)
+        if trade is not None:
+            with self._cache_lock:
+                self._trade_cache[trade_id] = trade
+                if len(self._trade_cache) > TRADE_CACHE_SIZE:
+                    self._trade_cache.popitem(last=False)
+        return trade
     
     def get_daily_summary(self, date: str = None) -> Dict:
         """Get daily trading summary."""
@@ -428,13 +586,58 @@ class DataManager:
     
     # ==================== Health & Monitoring ====================
     
+    def _cached_probe(self, name: str, probe) -> dict:
+        """
+        Return a probe result, refreshing it in the background once stale.
+        
+        The first call runs the probe inline; afterwards callers get the last
+        result immediately and at most one refresh thread runs per probe.
+        
+        Args:
+            name: Probe name (cache key)
+            probe: Zero-argument callable returning a dict
+        """
+        with self._probe_lock:
+            entry = self._probes.get(name)
+            if entry is not None:
+                checked_at, value = entry
+                if (time.monotonic() - checked_at >= HEALTH_CACHE_TTL_SECONDS
+                        and name not in self._probes_refreshing):
+                    self._probes_refreshing.add(name)
+                    threading.Thread(
+                        target=self._refresh_probe, args=(name, probe),
+                        name=f"datamanager-{name}", daemon=True
+                    ).start()
+                return dict(value)
+        
+        value = probe()
+        with self._probe_lock:
+            self._probes[name] = (time.monotonic(), value)
+        return dict(value)
+    
+    def _refresh_probe(self, name: str, probe):
+        """Re-run a probe and store its result (background thread)."""
+        try:
+            value = probe()
+            with self._probe_lock:
+                self._probes[name] = (time.monotonic(), value)
+        except Exception as e:
+            log.error(f"DataManager {name} refresh error: {e}")
+        finally:
+            with self._probe_lock:
+                self._probes_refreshing.discard(name)
+    
     def health_check(self) -> dict:
         """
-        Check health of all systems.
+        Check health of all systems (cached for HEALTH_CACHE_TTL_SECONDS).
         
         Returns:
             Health status dict
         """
+        return self._cached_probe('health', self._check_health)
+    
+    def _check_health(self) -> dict:
+        """Ping Redis and InfluxDB."""
         return {
             'redis': self.redis.health_check(),
             'influxdb': self.influx.health_check(),
@@ -444,56 +647,27 @@ class DataManager:
     
     def get_system_info(self) -> dict:
         """
-        Get system information.
+        Get system information (cached for HEALTH_CACHE_TTL_SECONDS).
         
         Returns:
             System info dict
         """
+        return self._cached_probe('system_info', self._collect_system_info)
+    
+    def _collect_system_info(self) -> dict:
+        """Query Redis, InfluxDB and SQLite for their current state."""
         return {
             'redis': self.redis.get_info() if self.redis.is_connected() else {},
             'influxdb': self.influx.get_bucket_info() if self.influx.is_connected() else {},
+            'influxdb_writes': self.influx.get_write_stats(),
             'sqlite': {
                 'db_size': self.sqlite.get_database_size(),
                 'table_counts': self.sqlite.get_table_counts()
-            }
+            },
+            'errors': dict(self._error_counts)
         }
     
-    # ==================== Signal Logging ====================
-    
-    def log_signal(self, signal_data: dict, approved: bool, rejection_reason: str = None):
-        """
-        Log all signals (approved and rejected).
-        
-        Args:
-            signal_data: Signal dictionary
-            approved: Whether signal was approved
-            rejection_reason: Reason for rejection if not approved
-        """
-        try:
-            # SQLite: Store signal metadata
-            self.sqlite.insert_signal(
-                signal_id=f"{signal_data['strategy_id']}_{signal_data['symbol']}_{signal_data['timestamp']}",
-                strategy_id=signal_data['strategy_id'],
-                symbol=signal_data['symbol'],
-                action=signal_data['action'],
-                price=signal_data['price'],
-                quantity=signal_data['quantity'],
-                timestamp=signal_data['timestamp'],
-                approved=approved,
-                rejection_reason=rejection_reason,
-                indicators=signal_data.get('indicators', {})
-            )
-            
-            # InfluxDB: Store for time-series analysis
-            self.influx.write_signal(
-                strategy_id=signal_data['strategy_id'],
-                symbol=signal_data['symbol'],
-                action=signal_data['action'],
-                approved=approved,
-                timestamp=signal_data['timestamp']
-            )
-        except Exception as e:
-            log.error(f"Error logging signal: {e}", exc_info=True)
+    # ==================== Trade Logging ====================
     
     def log_trade_open(self, trade_id: str, strategy_id: str, symbol: str,
                       entry_price: float, quantity: int, timestamp: datetime,
@@ -517,7 +691,7 @@ class DataManager:
                 signal_conditions
             )
         except Exception as e:
-            log.error(f"Error logging trade open: {e}", exc_info=True)
+            self._log_error("logging trade open", e)
     
     def log_trade_close(self, trade_id: str, exit_price: float, exit_time: datetime,
                        pnl: float, pnl_pct: float, exit_reason: str,
@@ -535,25 +709,26 @@ class DataManager:
             signal_conditions: Exit signal conditions
         """
         try:
-            # Get trade details
-            trade = self.sqlite.get_trade(trade_id)
-            if not trade:
-                log.warning(f"Trade {trade_id} not found for closing")
-                return
+            key = self._trade_positions.get(trade_id)
+            if key is not None:
+                # Opened by this process: close_position reads the quantity in-process
+                strategy_id, symbol = key
+                quantity = None
+            else:
+                trade = self.get_trade(trade_id)
+                if not trade:
+                    log.warning(f"Trade {trade_id} not found for closing")
+                    return
+                strategy_id, symbol, quantity = trade['strategy_id'], trade['symbol'], trade['quantity']
             
-            # Close position
+            # Close position (exit conditions go on the same UPDATE)
             self.close_position(
-                trade_id, trade['strategy_id'], trade['symbol'],
-                exit_price, exit_time, pnl, pnl_pct, exit_reason
+                trade_id, strategy_id, symbol,
+                exit_price, exit_time, pnl, pnl_pct, exit_reason,
+                quantity=quantity, signal_conditions=signal_conditions
             )
-            
-            # Store exit signal conditions
-            if signal_conditions:
-                self.sqlite.insert_signal_conditions(
-                    trade_id, 'exit', signal_conditions, exit_time
-                )
         except Exception as e:
-            log.error(f"Error logging trade close: {e}", exc_info=True)
+            self._log_error("logging trade close", e)
     
     def log_position_update(self, strategy_id: str, symbol: str, current_price: float,
                            quantity: int, unrealized_pnl: float, timestamp: datetime = None):
@@ -569,20 +744,26 @@ class DataManager:
             timestamp: Snapshot timestamp
         """
         try:
-            # Calculate entry price from position
-            position = self.redis.get_position(strategy_id, symbol)
+            # Calculate entry price from position (in-process first, Redis after a restart)
+            position = self._positions.get((strategy_id, symbol))
+            if position is None:
+                position = self.redis.get_position(strategy_id, symbol)
             if not position:
                 return
             
             entry_price = position.get('entry_price', current_price)
-            unrealized_pnl_pct = ((current_price - entry_price) / entry_price) * 100
+            pct_scale = position.get('pnl_pct_scale')
+            if pct_scale is None:
+                # 100 / entry_price, kept on the in-process position after the first snapshot
+                pct_scale = position['pnl_pct_scale'] = 100.0 / entry_price
+            unrealized_pnl_pct = (current_price - entry_price) * pct_scale
             
             self.update_position_snapshot(
                 strategy_id, symbol, current_price,
                 quantity, unrealized_pnl, unrealized_pnl_pct
             )
         except Exception as e:
-            log.error(f"Error logging position update: {e}", exc_info=True)
+            self._log_error("logging position update", e)
     
     def log_indicator_values(self, symbol: str, indicators: dict, timestamp: datetime = None):
         """
@@ -596,7 +777,7 @@ class DataManager:
         try:
             self.cache_indicators(symbol, indicators)
         except Exception as e:
-            log.error(f"Error logging indicator values: {e}", exc_info=True)
+            self._log_error("logging indicator values", e)
     
     def log_candle(self, symbol: str, timeframe: str, candle_data: dict, timestamp: datetime):
         """
@@ -621,7 +802,7 @@ class DataManager:
                 timestamp=timestamp
             )
         except Exception as e:
-            log.error(f"Error logging candle: {e}", exc_info=True)
+            self._log_error("logging candle", e)
     
     # ==================== Batch Operations ====================
     
@@ -633,14 +814,15 @@ class DataManager:
             ticks: List of tick data dicts
         """
         try:
-            for tick in ticks:
-                self.process_tick(
-                    tick['symbol'],
-                    tick,
-                    tick.get('timestamp')
-                )
+            # Redis: One round-trip for all latest-tick updates
+            with self._redis_pipeline() as pipe:
+                for tick in ticks:
+                    self.redis.set_latest_tick(tick['symbol'], tick, pipe=pipe)
+            
+            # InfluxDB: One batch for the whole tick history
+            self.influx.write_batch_ticks(ticks)
         except Exception as e:
-            log.error(f"Error batch logging ticks: {e}", exc_info=True)
+            self._log_error("batch logging ticks", e)
     
     def batch_log_indicators(self, indicators_list: List[dict]):
         """
@@ -650,14 +832,15 @@ class DataManager:
             indicators_list: List of dicts with 'symbol' and 'indicators' keys
         """
         try:
-            for item in indicators_list:
-                self.log_indicator_values(
-                    item['symbol'],
-                    item['indicators'],
-                    item.get('timestamp')
-                )
+            # Redis: One round-trip for all indicator caches
+            with self._redis_pipeline() as pipe:
+                for item in indicators_list:
+                    self.redis.set_indicators(item['symbol'], item['indicators'], pipe=pipe)
+            
+            # InfluxDB: One batch for every numeric indicator value
+            self.influx.write_batch_indicators(indicators_list)
         except Exception as e:
-            log.error(f"Error batch logging indicators: {e}", exc_info=True)
+            self._log_error("batch logging indicators", e)
     
     # ==================== Query Methods ====================
     
@@ -675,7 +858,7 @@ class DataManager:
         try:
             return self.get_closed_trades(strategy_id, limit)
         except Exception as e:
-            log.error(f"Error getting trade history: {e}", exc_info=True)
+            self._log_error("getting trade history", e)
             return []
     
     def get_performance_metrics(self, strategy_id: str, date_range: tuple = None) -> Dict:
@@ -700,12 +883,34 @@ class DataManager:
             
             return stats
         except Exception as e:
-            log.error(f"Error getting performance metrics: {e}", exc_info=True)
+            self._log_error("getting performance metrics", e)
             return {}
     
     def close(self):
         """Close all connections."""
+        global _data_manager_instance
+        
         self.redis.close()
         self.influx.close()
         self.sqlite.close()
+        with _data_manager_lock:
+            if _data_manager_instance is self:
+                _data_manager_instance = None
         log.info("✓ DataManager closed")
+
+
+# Global instance
+_data_manager_instance = None
+_data_manager_lock = threading.Lock()
+
+
+def get_data_manager() -> DataManager:
+    """Get or create the shared DataManager (one set of Redis/InfluxDB/SQLite connections)"""
+    global _data_manager_instance
+    
+    if _data_manager_instance is None:
+        with _data_manager_lock:
+            if _data_manager_instance is None:
+                _data_manager_instance = DataManager()
+    
+    return _data_manager_instance
@@ -3,69 +3,287 @@ InfluxDB Manager for VELOX Trading System.
 
 InfluxDB Schema:
 
+Per-event ids (trade_id, order_id) are fields, never tags: every distinct tag
+value creates a new series, and unbounded series counts slow every write.
+
 Measurement: ticks
 - tags: symbol, source
 - fields: open, high, low, close, volume, bid, ask
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 
 Measurement: indicators
-- tags: symbol, indicator_type
-- fields: value, period
-- timestamp: nanosecond precision
+- tags: symbol
+- fields: one float per indicator (e.g. rsi, ema_9, atr), plus {indicator}_period when known
+- timestamp: millisecond precision
 
 Measurement: positions
 - tags: strategy_id, symbol
 - fields: price, quantity, unrealized_pnl, unrealized_pnl_pct
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 
 Measurement: trailing_sl
-- tags: strategy_id, symbol, trade_id
-- fields: current_sl, highest_price, sl_type
-- timestamp: nanosecond precision
+- tags: strategy_id, symbol, sl_type, trade_slot (crc32(trade_id) % TRADE_SLOTS)
+- fields: current_sl, highest_price, trade_id
+- timestamp: millisecond precision
 
 Measurement: trades
 - tags: strategy_id, symbol, action
 - fields: price, quantity, pnl
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 
 Measurement: strategy_metrics
 - tags: strategy_id
 - fields: positions_count, signals_count, pnl, win_rate
-- timestamp: nanosecond precision
+- timestamp: second precision
 
 Measurement: signals (NEW - for trade verification)
 - tags: strategy_id, symbol, action, status (approved/rejected)
 - fields: price, quantity, reason, rejection_reason, all indicator values
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 
 Measurement: order_execution (NEW - for execution quality)
-- tags: strategy_id, symbol, action, order_id
-- fields: requested_price, filled_price, slippage, slippage_pct, fill_time_ms
-- timestamp: nanosecond precision
+- tags: strategy_id, symbol, action
+- fields: order_id, requested_price, filled_price, slippage, slippage_pct, fill_time_ms
+- timestamp: millisecond precision
 
 Measurement: trade_details (NEW - comprehensive trade info)
-- tags: strategy_id, symbol, trade_id, action, is_winner
-- fields: entry_price, exit_price, quantity, pnl, pnl_pct, duration_seconds, exit_reason
+- tags: strategy_id, symbol, action, is_winner
+- fields: trade_id, entry_price, exit_price, quantity, pnl, pnl_pct, duration_seconds, exit_reason
          max_favorable_excursion, max_adverse_excursion, slippage_pct
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 
 Measurement: strategy_health (NEW - real-time strategy monitoring)
 - tags: strategy_id, strategy_type
 - fields: open_positions_count, total_trades_today, win_count, loss_count, win_rate_pct
          avg_win_pct, avg_loss_pct, profit_factor, total_pnl, avg_trade_duration_minutes
          signals_generated_today, signals_approved_today, approval_rate_pct, is_active
-- timestamp: nanosecond precision
+- timestamp: millisecond precision
 """
 
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import logging
-from typing import Optional, List, Dict
+from math import isfinite
+import multiprocessing
+import queue
+import random
+import re
+import socket
+import threading
+import zlib
+import time
+from typing import Optional, List, Dict, Iterator
+
+import numpy as np
 
 log = logging.getLogger(__name__)
 
+# Background flusher defaults: one POST per BATCH_SIZE points or FLUSH_INTERVAL_SECONDS
+BATCH_SIZE = 5000
+FLUSH_INTERVAL_SECONDS = 1.0
+BUFFER_MAX_POINTS = 100_000  # Points beyond this are dropped, never blocking the caller
+OVERFLOW_LOG_EVERY = 10_000  # Dropped points between buffer-full warnings
+TICK_BLOCK_SIZE = 8192  # Rows per columnar tick block
+UDP_DATAGRAM_MAX = 1400  # Line-protocol bytes per datagram, under a 1500-byte MTU
+# Failed batch writes: retry_interval * exponential_base**attempt, capped, plus jitter
+MAX_RETRIES = 3
+RETRY_INTERVAL_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 5.0
+RETRY_EXPONENTIAL_BASE = 2
+RETRY_JITTER_SECONDS = 0.1
+CONNECTION_POOL_MAXSIZE = 32  # Persistent HTTP connections shared by writes and dashboard queries
+QUERY_CONCURRENCY = 4  # Flux queries query_many() keeps in flight at once
+# trailing_sl series per strategy/symbol/sl_type: trades spread over this many
+# slots so concurrent trades rarely share a series, without a tag per trade
+TRADE_SLOTS = 32
+
+# Flux query templates: values arrive as query parameters, never spliced into the text.
+# influxdb-client declares each params key as an option, so they are bare names here
+_Q_TICK_RANGE = '''
+from(bucket: bucket)
+  |> range(start: start, stop: stop)
+  |> filter(fn: (r) => r["_measurement"] == "ticks")
+  |> filter(fn: (r) => r["symbol"] == symbol)
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+_Q_INDICATORS = '''
+from(bucket: bucket)
+  |> range(start: start, stop: stop)
+  |> filter(fn: (r) => r["_measurement"] == "indicators")
+  |> filter(fn: (r) => r["symbol"] == symbol)
+  |> filter(fn: (r) => r["_field"] == field)
+'''
+_Q_POSITION_HISTORY = '''
+from(bucket: bucket)
+  |> range(start: start)
+  |> filter(fn: (r) => r["_measurement"] == "positions")
+  |> filter(fn: (r) => r["strategy_id"] == strategy_id)
+  |> filter(fn: (r) => r["symbol"] == symbol)
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+_Q_SL_TIMELINE = '''
+from(bucket: bucket)
+  |> range(start: -24h)
+  |> filter(fn: (r) => r["_measurement"] == "trailing_sl")
+  |> filter(fn: (r) => r["trade_slot"] == trade_slot)
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+  |> filter(fn: (r) => r["trade_id"] == trade_id)
+'''
+_Q_STRATEGY_PERFORMANCE = '''
+from(bucket: bucket)
+  |> range(start: start)
+  |> filter(fn: (r) => r["_measurement"] == "strategy_metrics")
+  |> filter(fn: (r) => r["strategy_id"] == strategy_id)
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+_Q_TRADES_SUMMARY = '''
+from(bucket: bucket)
+  |> range(start: start)
+  |> filter(fn: (r) => r["_measurement"] == "trades")
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+_Q_STRATEGY_TRADES_SUMMARY = '''
+from(bucket: bucket)
+  |> range(start: start)
+  |> filter(fn: (r) => r["_measurement"] == "trades")
+  |> filter(fn: (r) => r["strategy_id"] == strategy_id)
+  |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
+'''
+
+_DURATION_PART = re.compile(r'(\d+)(ns|us|µs|ms|s|mo|m|h|d|w|y)')
+_DURATION_UNITS = {
+    'ns': timedelta(microseconds=0.001), 'us': timedelta(microseconds=1),
+    'µs': timedelta(microseconds=1), 'ms': timedelta(milliseconds=1),
+    's': timedelta(seconds=1), 'm': timedelta(minutes=1), 'h': timedelta(hours=1),
+    'd': timedelta(days=1), 'w': timedelta(weeks=1),
+    'mo': timedelta(days=30), 'y': timedelta(days=365),
+}
+
+_STOP = object()  # Sentinel that wakes the flusher on close()
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Default timestamp precision for HTTP writes; finer digits only bloat the payload
+WRITE_PRECISION = 'ms'
+_NS_PER_UNIT = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+
+# Line-protocol escaping for tag keys/values (commas, spaces and equals signs)
+_TAG_ESCAPES = str.maketrans({',': '\\,', ' ': '\\ ', '=': '\\='})
+
+
+@lru_cache(maxsize=4096)
+def _escape_tag(value) -> str:
+    """Escape a tag value for line protocol (memoized: tag values repeat)."""
+    return str(value).translate(_TAG_ESCAPES)
+
+
+def trade_slot(trade_id) -> str:
+    """
+    Stable low-cardinality trailing_sl tag for a trade id.
+    
+    Writers tag trailing_sl points with it and readers filter on it, so both
+    must call this one function.
+    """
+    return str(zlib.crc32(str(trade_id).encode()) % TRADE_SLOTS)
+
+
+def _escape_string(value) -> str:
+    """Quote a string field value for line protocol."""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _to_ns(timestamp) -> int:
+    """
+    Convert a timestamp to epoch nanoseconds (naive datetimes are UTC).
+    
+    Args:
+        timestamp: datetime, epoch-ns int, or None for now
+    """
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        delta = timestamp - _EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    return int(timestamp)
+
+
+def _flux_time(value):
+    """
+    Convert a range bound to a Flux query parameter.
+    
+    Args:
+        value: datetime, relative duration like '-1h' or '-1h30m', ISO-8601
+            string, or None/'now()' for the current time
+    
+    Returns:
+        datetime or timedelta
+    """
+    if value is None or value == 'now()':
+        return datetime.now(timezone.utc)
+    if isinstance(value, (datetime, timedelta)):
+        return value
+    text = str(value).strip()
+    sign = -1 if text.startswith('-') else 1
+    body = text.lstrip('-+')
+    parts = _DURATION_PART.findall(body)
+    if parts and ''.join(amount + unit for amount, unit in parts) == body:
+        return sign * sum((int(amount) * _DURATION_UNITS[unit] for amount, unit in parts), timedelta())
+    return datetime.fromisoformat(text)
+
+
+_TICK_PRICE_FIELDS = ('ask', 'bid', 'close', 'high', 'low', 'open')
+
+
+def _render_tick_lines(prefixes: list, block: tuple, n: int) -> List[bytes]:
+    """
+    Render the first n rows of a tick block as line protocol.
+    
+    Module-level so it can also run in a worker process.
+    
+    Args:
+        prefixes: Escaped "ticks,tags " prefix per interned key id
+        block: (prices, volumes, timestamps, keys) column arrays, timestamps
+            already in the write precision
+        n: Number of filled rows
+    """
+    prices, volumes, timestamps, keys = block
+    rows = zip(prices[:n].tolist(), volumes[:n].tolist(),
+               timestamps[:n].tolist(), keys[:n].tolist())
+    finite = np.isfinite(prices[:n]).all(axis=1)
+    if finite.all():
+        return [
+            f"{prefixes[key]}ask={ask!r},bid={bid!r},close={close!r},"
+            f"high={high!r},low={low!r},open={open_!r},volume={volume}i {ts}".encode()
+            for (ask, bid, close, high, low, open_), volume, ts, key in rows
+        ]
+
+    # Line protocol has no NaN/inf and one bad value rejects the whole batch,
+    # so rows holding one drop just those fields
+    return [
+        _tick_line_bytes(prefixes[key], row, volume, ts)
+        for (row, volume, ts, key) in rows
+    ]
+
+
+def _tick_line_bytes(prefix: str, prices, volume: int, ts: int) -> bytes:
+    """Render one tick row (ask/bid/close/high/low/open), skipping non-finite prices."""
+    fields = [
+        f"{name}={value!r}" for name, value in zip(_TICK_PRICE_FIELDS, prices)
+        if isfinite(value)
+    ]
+    fields.append(f"volume={volume}i")
+    return f"{prefix}{','.join(fields)} {ts}".encode()
+
+
 try:
     from influxdb_client import InfluxDBClient, Point, WritePrecision
-    from influxdb_client.client.write_api import SYNCHRONOUS, ASYNCHRONOUS
+    from influxdb_client.client.write_api import SYNCHRONOUS
+    from influxdb_client.rest import ApiException
+    from urllib3.exceptions import HTTPError
+    from urllib3.connection import HTTPConnection
     INFLUX_AVAILABLE = True
 except ImportError:
     INFLUX_AVAILABLE = False
@@ -77,8 +295,9 @@ class InfluxManager:
     High-performance time-series storage using InfluxDB.
     
     Features:
-    - Nanosecond precision timestamps
-    - Asynchronous writes for performance
+    - Millisecond timestamps by default (configurable)
+    - Buffered writes flushed in batches by a background thread
+    - Gzip-compressed write payloads
     - Efficient querying with Flux language
     - Automatic batching
     - Health monitoring
@@ -87,7 +306,18 @@ class InfluxManager:
     def __init__(self, url='http://localhost:8086', 
                  token='velox-super-secret-token',
                  org='velox', 
-                 bucket='trading'):
+                 bucket='trading',
+                 udp_address: tuple = None,
+                 enable_gzip: bool = True,
+                 render_in_process: bool = False,
+                 batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL_SECONDS,
+                 write_precision: str = WRITE_PRECISION,
+                 connection_pool_maxsize: int = CONNECTION_POOL_MAXSIZE,
+                 max_retries: int = MAX_RETRIES,
+                 retry_interval: float = RETRY_INTERVAL_SECONDS,
+                 max_retry_delay: float = MAX_RETRY_DELAY_SECONDS,
+                 exponential_base: float = RETRY_EXPONENTIAL_BASE):
         """
         Initialize InfluxDB connection.
         
@@ -96,6 +326,20 @@ class InfluxManager:
             token: Authentication token
             org: Organization name
             bucket: Bucket name for data storage
+            udp_address: Optional (host, port) of a UDP line-protocol listener
+                (InfluxDB 1.x or a Telegraf socket_listener) for lossy telemetry
+            enable_gzip: Gzip line-protocol batches (Content-Encoding: gzip)
+            render_in_process: Format full tick blocks in a worker process so the
+                flusher does not hold the GIL against tick producers
+            batch_size: Maximum points per write request
+            flush_interval: Seconds the flusher waits before sending a partial batch
+            write_precision: Timestamp precision for writes ('s', 'ms', 'us' or 'ns');
+                forced to 'ns' with udp_address, which listeners parse as nanoseconds
+            connection_pool_maxsize: Keep-alive connections kept per host
+            max_retries: Retries for a batch that failed with 429/5xx or a network error
+            retry_interval: Delay before the first retry, in seconds
+            max_retry_delay: Upper bound on any single retry delay, in seconds
+            exponential_base: Growth factor of the retry delay
         """
         self.url = url
         self.token = token
@@ -104,18 +348,80 @@ class InfluxManager:
         self.client = None
         self.write_api = None
         self.query_api = None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.write_precision = 'ns' if udp_address else write_precision
+        self._ns_per_unit = _NS_PER_UNIT[self.write_precision]
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.max_retry_delay = max_retry_delay
+        self.exponential_base = exponential_base
+        # Entries are (points, record); the bound is on points, since one
+        # entry may be a whole tick block
+        self._buffer = queue.Queue()
+        self._buffer_lock = threading.Lock()
+        self._queued_points = 0
+        self._flusher = None
+        # True only while the flusher runs; the write_* methods check it so
+        # nothing is queued that no thread would drain
+        self._connected = False
+        self.overflow_count = 0
+        self.dropped_points = 0  # Points in batches that failed after all retries
+        self.udp_address = udp_address
+        self.udp_socket = None
+        self._udp_lock = threading.Lock()
+        self._udp_pending = bytearray()
+        # Escaped "measurement,tags " prefixes; the symbol/tag sets are fixed at runtime
+        self._tick_prefixes = {}
+        self._indicator_prefixes = {}
+        self._position_prefixes = {}
+        self._trade_prefixes = {}
+        self._field_keys = {}
+        # Columnar tick buffer: (symbol, source) keys are interned to row ids
+        self._tick_lock = threading.Lock()
+        self._tick_keys = {}
+        self._tick_key_prefixes = []
+        self._tick_block = self._new_tick_block()
+        self._tick_count = 0
+        self._render_pool = None
+        self._query_pool = None
+        self._query_pool_lock = threading.Lock()
         
         if not INFLUX_AVAILABLE:
             log.warning("InfluxDB client not available. Time-series data will not be stored.")
             return
         
         try:
-            self.client = InfluxDBClient(url=url, token=token, org=org)
-            self.write_api = self.client.write_api(write_options=ASYNCHRONOUS)
+            # Tick batches repeat the same tags and near-identical values, so
+            # gzip shrinks the POST body several-fold
+            self.client = InfluxDBClient(url=url, token=token, org=org,
+                                         enable_gzip=enable_gzip,
+                                         connection_pool_maxsize=connection_pool_maxsize)
+            # Pooled connections are reused across flushes; TCP keepalive stops
+            # NATs/firewalls from silently dropping them between quiet periods
+            self.client.api_client.rest_client.pool_manager.connection_pool_kw['socket_options'] = (
+                HTTPConnection.default_socket_options
+                + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+            # Writes happen on the flusher thread, so a blocking API is fine there
+            self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
             self.query_api = self.client.query_api()
             
             # Test connection
             if self.health_check():
+                if render_in_process:
+                    # spawn: forking a process that already runs writer threads is unsafe
+                    self._render_pool = ProcessPoolExecutor(
+                        max_workers=1, mp_context=multiprocessing.get_context('spawn')
+                    )
+                if udp_address:
+                    self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    log.info(f"✓ InfluxDB telemetry over UDP: {udp_address[0]}:{udp_address[1]}")
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="influx-flusher", daemon=True
+                )
+                self._flusher.start()
+                self._connected = True
                 log.info(f"✓ InfluxDB connected: {url}")
             else:
                 log.warning(f"⚠️  InfluxDB connection failed: {url}")
@@ -126,7 +432,293 @@ class InfluxManager:
     
     def is_connected(self) -> bool:
         """Check if InfluxDB is connected."""
-        return self.client is not None
+        return self._connected
+    
+    # ==================== Write Buffer ====================
+    
+    def _submit(self, record, points: int = 1):
+        """
+        Queue a point (or a deferred (builder, args) tuple) for the flusher.
+        
+        Never blocks: when BUFFER_MAX_POINTS points are already queued the
+        record is dropped and counted in overflow_count.
+        
+        Args:
+            record: Point, line-protocol bytes or (builder, args) tuple
+            points: Number of points the record expands to
+        """
+        with self._buffer_lock:
+            if self._queued_points + points > BUFFER_MAX_POINTS:
+                before = self.overflow_count
+                self.overflow_count = overflow = before + points
+            else:
+                self._queued_points += points
+                overflow = 0
+        if overflow:
+            # Once per OVERFLOW_LOG_EVERY points, however many each record carried
+            if not before or before // OVERFLOW_LOG_EVERY != overflow // OVERFLOW_LOG_EVERY:
+                log.warning(f"InfluxDB buffer full, {overflow} points dropped so far")
+            return
+        self._buffer.put_nowait((points, record))
+    
+    def _submit_telemetry(self, record):
+        """
+        Route a loss-tolerant point (ticks, indicators, snapshots, SL updates).
+        
+        Goes out over UDP when udp_address is configured, packed with other
+        lines into datagrams of up to UDP_DATAGRAM_MAX bytes, otherwise through
+        the regular write buffer. Trades and signals always use the buffer so
+        they are never sent over a lossy transport.
+        """
+        if self.udp_socket is None:
+            self._submit(record)
+            return
+        
+        if type(record) is tuple:
+            builder, args = record
+            record = builder(*args)
+            if record is None:
+                return
+        if not isinstance(record, bytes):
+            record = record.to_line_protocol().encode()
+        
+        with self._udp_lock:
+            pending = self._udp_pending
+            if pending and len(pending) + 1 + len(record) > UDP_DATAGRAM_MAX:
+                self._send_udp(bytes(pending))
+                pending.clear()
+            if pending:
+                pending += b"\n"
+            pending += record
+    
+    def _flush_udp(self):
+        """Send the partially filled UDP datagram, if any."""
+        if self.udp_socket is None:
+            return
+        with self._udp_lock:
+            if self._udp_pending:
+                self._send_udp(bytes(self._udp_pending))
+                self._udp_pending.clear()
+    
+    def _send_udp(self, datagram: bytes):
+        """Send one datagram; loss is acceptable, so errors are only logged."""
+        try:
+            self.udp_socket.sendto(datagram, self.udp_address)
+        except OSError as e:
+            log.error(f"InfluxDB UDP send error: {e}")
+    
+    # ==================== Columnar Tick Buffer ====================
+    
+    @staticmethod
+    def _new_tick_block() -> tuple:
+        """
+        Allocate one struct-of-arrays tick block.
+        
+        Returns:
+            (prices[N, 6] as ask/bid/close/high/low/open, volume[N], ts[N], key[N])
+        """
+        return (
+            np.empty((TICK_BLOCK_SIZE, 6), dtype=np.float64),
+            np.empty(TICK_BLOCK_SIZE, dtype=np.int64),
+            np.empty(TICK_BLOCK_SIZE, dtype=np.int64),
+            np.empty(TICK_BLOCK_SIZE, dtype=np.int32),
+        )
+    
+    def _append_tick(self, symbol: str, tick_data: dict, ts: int):
+        """Store one tick as a row of the current columnar block."""
+        get = tick_data.get
+        source = get('source', 'simulator')
+        close = get('close', 0)
+        row = (get('ask', close), get('bid', close), close,
+               get('high', close), get('low', close), get('open', close))
+        volume = get('volume', 0)
+        
+        with self._tick_lock:
+            key = self._tick_key(symbol, source)
+            prices, volumes, timestamps, keys = self._tick_block
+            n = self._tick_count
+            prices[n] = row
+            volumes[n] = volume
+            timestamps[n] = ts
+            keys[n] = key
+            self._tick_count = n + 1
+            
+            if self._tick_count < TICK_BLOCK_SIZE:
+                return
+            full_block = self._tick_block
+            self._tick_block = self._new_tick_block()
+            self._tick_count = 0
+        
+        self._queue_tick_block(full_block)
+    
+    def _tick_key(self, symbol: str, source: str) -> int:
+        """Intern a (symbol, source) pair to a row key id. Caller holds _tick_lock."""
+        key = self._tick_keys.get((symbol, source))
+        if key is None:
+            key = self._tick_keys[(symbol, source)] = len(self._tick_key_prefixes)
+            self._tick_key_prefixes.append(
+                f"ticks,source={_escape_tag(source)},symbol={_escape_tag(symbol)} "
+            )
+        return key
+    
+    def _append_tick_columns(self, prices: np.ndarray, volumes: np.ndarray,
+                             timestamps: np.ndarray, keys: np.ndarray):
+        """Copy whole columns into the tick block, slice by slice."""
+        full_blocks = []
+        with self._tick_lock:
+            start, total = 0, len(keys)
+            while start < total:
+                n = self._tick_count
+                stop = min(total, start + TICK_BLOCK_SIZE - n)
+                block = self._tick_block
+                for column, values in zip(block, (prices, volumes, timestamps, keys)):
+                    column[n:n + stop - start] = values[start:stop]
+                self._tick_count = n + stop - start
+                start = stop
+                if self._tick_count == TICK_BLOCK_SIZE:
+                    full_blocks.append(block)
+                    self._tick_block = self._new_tick_block()
+                    self._tick_count = 0
+        
+        for block in full_blocks:
+            self._queue_tick_block(block)
+    
+    def _queue_tick_block(self, block: tuple):
+        """Hand a full block to the flusher without waiting for the interval."""
+        self._submit((self._render_ticks, (block, TICK_BLOCK_SIZE)), TICK_BLOCK_SIZE)
+    
+    def _take_ticks(self) -> list:
+        """Detach the partially filled tick block and render it."""
+        with self._tick_lock:
+            n = self._tick_count
+            if not n:
+                return []
+            block = self._tick_block
+            self._tick_block = self._new_tick_block()
+            self._tick_count = 0
+        return self._render_ticks(block, n)
+    
+    def _render_ticks(self, block: tuple, n: int) -> List[bytes]:
+        """Render the first n rows of a tick block, in the worker process if enabled."""
+        if self._render_pool is not None:
+            try:
+                # Waiting on the result keeps batches in order; the GIL is free meanwhile
+                return self._render_pool.submit(
+                    _render_tick_lines, list(self._tick_key_prefixes),
+                    tuple(column[:n] for column in block), n
+                ).result()
+            except Exception as e:
+                log.error(f"InfluxDB tick render worker error: {e}. Rendering in-process.")
+                self._render_pool.shutdown(wait=False)
+                self._render_pool = None
+        return _render_tick_lines(self._tick_key_prefixes, block, n)
+    
+    def _drain(self, timeout: float) -> tuple:
+        """
+        Collect up to batch_size buffered points, waiting at most timeout seconds.
+        
+        Returns:
+            (points, stop_requested)
+        """
+        batch = []
+        taken = 0
+        stop = False
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._buffer.get(timeout=remaining)
+                else:
+                    item = self._buffer.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stop = True
+                break
+            points, record = item
+            taken += points
+            if type(record) is tuple:
+                # Deferred point: build it here, off the caller's thread
+                builder, args = record
+                try:
+                    record = builder(*args)
+                except Exception as e:
+                    log.error(f"InfluxDB point build error: {e}")
+                    continue
+                if type(record) is list:
+                    batch.extend(record)  # A rendered tick block
+                    continue
+                if record is None:
+                    continue  # Nothing to write (e.g. no ready indicators)
+            batch.append(record)
+        
+        if taken:
+            with self._buffer_lock:
+                self._queued_points -= taken
+        return batch, stop
+    
+    def _write_points(self, points: list):
+        """
+        Send points in requests of at most batch_size points each.
+        
+        A drained batch can exceed batch_size by up to two tick blocks (a full
+        block plus the partial one), so it is split here.
+        """
+        size = self.batch_size
+        for start in range(0, len(points), size):
+            self._write_request(points[start:start + size])
+    
+    def _write_request(self, points: list):
+        """
+        Send one batch of points in a single request.
+        
+        Throttling (429), server errors (5xx) and network errors are retried
+        with exponential backoff; anything else (e.g. a rejected point) drops
+        the batch at once.
+        """
+        attempt = 0
+        while True:
+            try:
+                self.write_api.write(bucket=self.bucket, record=points,
+                                     write_precision=self.write_precision)
+                return
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    self.dropped_points += len(points)
+                    log.error(f"InfluxDB flush error ({len(points)} points dropped): {e}")
+                    return
+                delay = min(self.retry_interval * self.exponential_base ** attempt,
+                            self.max_retry_delay)
+                attempt += 1
+                log.warning(f"InfluxDB flush error, retry {attempt}/{self.max_retries} "
+                            f"in {delay:.1f}s: {e}")
+                time.sleep(delay + random.uniform(0, RETRY_JITTER_SECONDS))
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether a failed write may succeed if sent again."""
+        if isinstance(error, ApiException):
+            return error.status == 429 or (error.status or 0) >= 500
+        return isinstance(error, (HTTPError, OSError))
+    
+    def _flush_loop(self):
+        """Flush buffered points by size or interval until close()."""
+        stopping = False
+        while not stopping:
+            batch, stopping = self._drain(self.flush_interval)
+            batch.extend(self._take_ticks())
+            if batch:
+                self._write_points(batch)
+            self._flush_udp()
+        
+        # Write whatever was queued behind the stop sentinel
+        while True:
+            batch, _ = self._drain(0)
+            batch.extend(self._take_ticks())
+            if not batch:
+                break
+            self._write_points(batch)
     
     # ==================== Write Operations ====================
     
@@ -139,28 +731,107 @@ class InfluxManager:
             tick_data: Dict with open, high, low, close, volume
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
-            point = Point("ticks") \
-                .tag("symbol", symbol) \
-                .tag("source", tick_data.get('source', 'simulator')) \
-                .field("open", float(tick_data.get('open', tick_data.get('close', 0)))) \
-                .field("high", float(tick_data.get('high', tick_data.get('close', 0)))) \
-                .field("low", float(tick_data.get('low', tick_data.get('close', 0)))) \
-                .field("close", float(tick_data.get('close', 0))) \
-                .field("volume", int(tick_data.get('volume', 0))) \
-                .field("bid", float(tick_data.get('bid', tick_data.get('close', 0)))) \
-                .field("ask", float(tick_data.get('ask', tick_data.get('close', 0)))) \
-                .time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            
-            self.write_api.write(bucket=self.bucket, record=point)
+            if self.udp_socket is not None:
+                self._submit_telemetry((self._tick_line, (symbol, tick_data, self._ts(timestamp))))
+            else:
+                self._append_tick(symbol, tick_data, self._ts(timestamp))
             return True
         except Exception as e:
             log.error(f"InfluxDB write_tick error: {e}")
             return False
     
+    def write_batch_ticks(self, ticks: List[dict]):
+        """
+        Write many ticks at once.
+        
+        Args:
+            ticks: List of tick dicts, each with 'symbol' and optional 'timestamp'
+        """
+        if not self._connected:
+            return False
+        
+        try:
+            # Rows land in the columnar block; the flusher renders and POSTs them
+            append = self._append_tick
+            for tick in ticks:
+                append(tick['symbol'], tick, self._ts(tick.get('timestamp')))
+            return True
+        except Exception as e:
+            log.error(f"InfluxDB write_batch_ticks error: {e}")
+            return False
+    
+    def _ts(self, timestamp) -> int:
+        """Convert a timestamp to an epoch integer in the write precision."""
+        return _to_ns(timestamp) // self._ns_per_unit
+    
+    def write_tick_arrays(self, symbols, opens, highs, lows, closes, volumes,
+                          timestamps=None, bids=None, asks=None,
+                          source: str = 'simulator'):
+        """
+        Write a batch of ticks given as parallel arrays (struct of arrays).
+        
+        The columns are copied into the tick buffer in bulk, with no per-tick
+        dict or Python loop.
+        
+        Args:
+            symbols: Symbol per row
+            opens, highs, lows, closes: Price columns
+            volumes: Volume column
+            timestamps: Epoch-nanosecond column (defaults to now for every row)
+            bids, asks: Optional quote columns (default to closes)
+            source: Source tag shared by all rows
+        """
+        if not self._connected:
+            return False
+        
+        try:
+            closes = np.asarray(closes, dtype=np.float64)
+            n = len(closes)
+            if not n:
+                return True
+            prices = np.empty((n, 6), dtype=np.float64)
+            prices[:, 0] = closes if asks is None else asks
+            prices[:, 1] = closes if bids is None else bids
+            prices[:, 2] = closes
+            prices[:, 3] = highs
+            prices[:, 4] = lows
+            prices[:, 5] = opens
+            volumes = np.asarray(volumes, dtype=np.int64)
+            if timestamps is None:
+                timestamps = np.full(n, self._ts(None), dtype=np.int64)
+            else:
+                timestamps = np.asarray(timestamps, dtype=np.int64) // self._ns_per_unit
+            
+            unique_symbols, inverse = np.unique(np.asarray(symbols), return_inverse=True)
+            with self._tick_lock:
+                key_ids = np.array(
+                    [self._tick_key(str(symbol), source) for symbol in unique_symbols],
+                    dtype=np.int32
+                )
+            self._append_tick_columns(prices, volumes, timestamps, key_ids[inverse])
+            return True
+        except Exception as e:
+            log.error(f"InfluxDB write_tick_arrays error: {e}")
+            return False
+    
+    def _tick_line(self, symbol: str, tick_data: dict, ts: int) -> bytes:
+        """Build a ticks line-protocol record."""
+        get = tick_data.get
+        source = get('source', 'simulator')
+        prefix = self._tick_prefixes.get((symbol, source))
+        if prefix is None:
+            prefix = f"ticks,source={_escape_tag(source)},symbol={_escape_tag(symbol)} "
+            self._tick_prefixes[(symbol, source)] = prefix
+        
+        close = float(get('close', 0))
+        prices = (float(get('ask', close)), float(get('bid', close)), close,
+                  float(get('high', close)), float(get('low', close)), float(get('open', close)))
+        return _tick_line_bytes(prefix, prices, int(get('volume', 0)), ts)
+    
     def write_indicator(self, symbol: str, indicator_type: str, value: float,
                        period: int = None, timestamp: datetime = None):
         """
@@ -173,25 +844,99 @@ class InfluxManager:
             period: Period used for calculation
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
-            point = Point("indicators") \
-                .tag("symbol", symbol) \
-                .tag("indicator_type", indicator_type) \
-                .field("value", float(value))
-            
+            fields = {indicator_type: value}
             if period:
-                point.field("period", int(period))
-            
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+                fields[f"{indicator_type}_period"] = int(period)
+            self._submit_telemetry((self._indicators_line, (symbol, fields, self._ts(timestamp))))
             return True
         except Exception as e:
             log.error(f"InfluxDB write_indicator error: {e}")
             return False
     
+    def write_indicators_multi(self, symbol: str, fields: Dict[str, float],
+                               timestamp: datetime = None):
+        """
+        Write all indicator values for a symbol as one multi-field point.
+        
+        Args:
+            symbol: Symbol name
+            fields: Dict of indicator name -> numeric value (None = not ready, skipped)
+            timestamp: Timestamp (defaults to now)
+        """
+        if not self._connected:
+            return False
+        
+        try:
+            self._submit_telemetry((self._indicators_line, (symbol, fields, self._ts(timestamp))))
+            return True
+        except Exception as e:
+            log.error(f"InfluxDB write_indicators_multi error: {e}")
+            return False
+    
+    def write_batch_indicators(self, indicators_list: List[dict]):
+        """
+        Write numeric indicator values for many symbols at once.
+        
+        Args:
+            indicators_list: List of dicts with 'symbol', 'indicators' and optional 'timestamp'
+        """
+        if not self._connected:
+            return False
+        
+        try:
+            # Timestamps are resolved now; the lines are rendered on the flusher
+            rows = [
+                (item['symbol'], item['indicators'], self._ts(item.get('timestamp')))
+                for item in indicators_list
+            ]
+            self._submit((self._indicators_lines, (rows,)), len(rows))
+            return True
+        except Exception as e:
+            log.error(f"InfluxDB write_batch_indicators error: {e}")
+            return False
+    
+    def _indicators_lines(self, rows: List[tuple]) -> List[bytes]:
+        """Build indicators records for (symbol, fields, ts) rows, dropping empty ones."""
+        build = self._indicators_line
+        return [line for line in (build(*row) for row in rows) if line is not None]
+    
+    def _indicators_line(self, symbol: str, fields: Dict[str, float], ts: int) -> Optional[bytes]:
+        """
+        Build a multi-field indicators line-protocol record.
+        
+        None and NaN/inf values (indicator still warming up) are skipped, as is
+        anything float() rejects. Returns None if no field is left.
+        """
+        prefix = self._indicator_prefixes.get(symbol)
+        if prefix is None:
+            prefix = self._indicator_prefixes[symbol] = f"indicators,symbol={_escape_tag(symbol)} "
+        
+        field_keys = self._field_keys
+        parts = []
+        for key, value in fields.items():
+            if type(value) is not float:
+                if value is None:
+                    continue
+                try:
+                    # Always float: a field must keep one type across points or the write is rejected
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+            if not isfinite(value):
+                continue  # Line protocol has no NaN/inf; one would reject the whole batch
+            field_key = field_keys.get(key)
+            if field_key is None:
+                field_key = field_keys[key] = _escape_tag(key)
+            parts.append(f"{field_key}={value!r}")
+        
+        if not parts:
+            return None
+        return f"{prefix}{','.join(parts)} {ts}".encode()
+    
     def write_position_snapshot(self, strategy_id: str, symbol: str,
                                 price: float, quantity: int,
                                 unrealized_pnl: float, unrealized_pnl_pct: float,
@@ -208,20 +953,26 @@ class InfluxManager:
             unrealized_pnl_pct: Unrealized P&L percentage
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
-            point = Point("positions") \
-                .tag("strategy_id", strategy_id) \
-                .tag("symbol", symbol) \
-                .field("price", float(price)) \
-                .field("quantity", int(quantity)) \
-                .field("unrealized_pnl", float(unrealized_pnl)) \
-                .field("unrealized_pnl_pct", float(unrealized_pnl_pct)) \
-                .time(timestamp or datetime.utcnow(), WritePrecision.NS)
+            price, unrealized_pnl, unrealized_pnl_pct = (
+                float(price), float(unrealized_pnl), float(unrealized_pnl_pct)
+            )
+            if not isfinite(price + unrealized_pnl + unrealized_pnl_pct):
+                return False  # NaN/inf cannot be written and would reject the batch
             
-            self.write_api.write(bucket=self.bucket, record=point)
+            prefix = self._position_prefixes.get((strategy_id, symbol))
+            if prefix is None:
+                prefix = self._position_prefixes[(strategy_id, symbol)] = (
+                    f"positions,strategy_id={_escape_tag(strategy_id)},symbol={_escape_tag(symbol)} "
+                )
+            self._submit_telemetry((
+                f"{prefix}price={price!r},quantity={int(quantity)}i,"
+                f"unrealized_pnl={unrealized_pnl!r},unrealized_pnl_pct={unrealized_pnl_pct!r} "
+                f"{self._ts(timestamp)}"
+            ).encode())
             return True
         except Exception as e:
             log.error(f"InfluxDB write_position_snapshot error: {e}")
@@ -242,20 +993,18 @@ class InfluxManager:
             sl_type: Type of stop loss
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
-            point = Point("trailing_sl") \
-                .tag("strategy_id", strategy_id) \
-                .tag("symbol", symbol) \
-                .tag("trade_id", trade_id) \
-                .tag("sl_type", sl_type) \
-                .field("current_sl", float(current_sl)) \
-                .field("highest_price", float(highest_price)) \
-                .time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            
-            self.write_api.write(bucket=self.bucket, record=point)
+            line = (
+                f"trailing_sl,sl_type={_escape_tag(sl_type)},strategy_id={_escape_tag(strategy_id)},"
+                f"symbol={_escape_tag(symbol)},trade_slot={trade_slot(trade_id)} "
+                f"current_sl={float(current_sl)!r},highest_price={float(highest_price)!r},"
+                f"trade_id={_escape_string(trade_id)} "
+                f"{self._ts(timestamp)}"
+            ).encode()
+            self._submit_telemetry(line)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_sl_update error: {e}")
@@ -276,22 +1025,24 @@ class InfluxManager:
             pnl: Profit/Loss (for exits)
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
-            point = Point("trades") \
-                .tag("strategy_id", strategy_id) \
-                .tag("symbol", symbol) \
-                .tag("action", action) \
-                .field("price", float(price)) \
-                .field("quantity", int(quantity))
-            
-            if pnl is not None:
-                point.field("pnl", float(pnl))
-            
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            key = (strategy_id, symbol, action)
+            prefix = self._trade_prefixes.get(key)
+            if prefix is None:
+                prefix = self._trade_prefixes[key] = (
+                    f"trades,action={_escape_tag(action)},strategy_id={_escape_tag(strategy_id)},"
+                    f"symbol={_escape_tag(symbol)} "
+                )
+            pnl_field = ""
+            if pnl is not None and isfinite(pnl):
+                pnl_field = f",pnl={float(pnl)!r}"
+            self._submit((
+                f"{prefix}price={float(price)!r},quantity={int(quantity)}i{pnl_field} "
+                f"{self._ts(timestamp)}"
+            ).encode())
             return True
         except Exception as e:
             log.error(f"InfluxDB write_trade error: {e}")
@@ -307,19 +1058,21 @@ class InfluxManager:
             metrics: Dict of metric name -> value
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
         
         try:
             point = Point("strategy_metrics") \
                 .tag("strategy_id", strategy_id)
             
+            field = point.field
             for key, value in metrics.items():
-                if isinstance(value, (int, float)):
-                    point.field(key, float(value))
+                if type(value) is float or isinstance(value, (int, float)):
+                    field(key, float(value))
             
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            # Periodic aggregates: second precision keeps the timestamp column small
+            point.time(_to_ns(timestamp) // _NS_PER_UNIT['s'], WritePrecision.S)
+            self._submit(point)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_strategy_metrics error: {e}")
@@ -332,11 +1085,12 @@ class InfluxManager:
         Args:
             points: List of Point objects
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
-            self.write_api.write(bucket=self.bucket, record=points)
+            for point in points:
+                self._submit(point)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_batch error: {e}")
@@ -361,32 +1115,44 @@ class InfluxManager:
             indicators: Dict of indicator values at signal time
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
-            point = Point("signals") \
-                .tag("strategy_id", strategy_id) \
-                .tag("symbol", symbol) \
-                .tag("action", action) \
-                .tag("status", status) \
-                .field("price", float(price)) \
-                .field("quantity", int(quantity)) \
-                .field("reason", reason)
-
+            # Built as a line-protocol record directly; no Point per signal
+            parts = [
+                f"price={float(price)!r}",
+                f"quantity={int(quantity)}i",
+            ]
+            if reason is not None:
+                parts.append(f"reason={_escape_string(reason)}")
             if rejection_reason:
-                point.field("rejection_reason", rejection_reason)
+                parts.append(f"rejection_reason={_escape_string(rejection_reason)}")
 
             # Add all indicator values as fields for detailed analysis
             if indicators:
+                field_keys = self._field_keys
                 for key, value in indicators.items():
-                    if isinstance(value, (int, float)):
-                        point.field(f"ind_{key}", float(value))
+                    # Exact-float check first: most values are plain floats
+                    if type(value) is float or isinstance(value, (int, float)):
+                        value = float(value)
+                        if not isfinite(value):
+                            continue
+                        value = repr(value)
                     elif isinstance(value, str):
-                        point.field(f"ind_{key}", value)
+                        value = _escape_string(value)
+                    else:
+                        continue
+                    field_key = field_keys.get(key)
+                    if field_key is None:
+                        field_key = field_keys[key] = _escape_tag(key)
+                    parts.append(f"ind_{field_key}={value}")
 
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            self._submit((
+                f"signals,action={_escape_tag(action)},status={_escape_tag(status)},"
+                f"strategy_id={_escape_tag(strategy_id)},symbol={_escape_tag(symbol)} "
+                f"{','.join(parts)} {self._ts(timestamp)}"
+            ).encode())
             return True
         except Exception as e:
             log.error(f"InfluxDB write_signal error: {e}")
@@ -412,7 +1178,7 @@ class InfluxManager:
             fill_time_ms: Time to fill in milliseconds
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
@@ -420,7 +1186,7 @@ class InfluxManager:
                 .tag("strategy_id", strategy_id) \
                 .tag("symbol", symbol) \
                 .tag("action", action) \
-                .tag("order_id", order_id) \
+                .field("order_id", str(order_id)) \
                 .field("requested_price", float(requested_price)) \
                 .field("filled_price", float(filled_price)) \
                 .field("slippage", float(slippage)) \
@@ -429,8 +1195,8 @@ class InfluxManager:
             if fill_time_ms is not None:
                 point.field("fill_time_ms", float(fill_time_ms))
 
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            point.time(self._ts(timestamp), self.write_precision)
+            self._submit(point)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_order_execution error: {e}")
@@ -468,7 +1234,7 @@ class InfluxManager:
             exit_indicators: Indicator values at exit
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
@@ -477,9 +1243,9 @@ class InfluxManager:
             point = Point("trade_details") \
                 .tag("strategy_id", strategy_id) \
                 .tag("symbol", symbol) \
-                .tag("trade_id", trade_id) \
                 .tag("action", action) \
-                .tag("is_winner", is_winner)
+                .tag("is_winner", is_winner) \
+                .field("trade_id", str(trade_id))
 
             if entry_price is not None:
                 point.field("entry_price", float(entry_price))
@@ -503,19 +1269,20 @@ class InfluxManager:
                 point.field("slippage_pct", float(slippage_pct))
 
             # Add entry indicators
+            field = point.field
             if entry_indicators:
                 for key, value in entry_indicators.items():
-                    if isinstance(value, (int, float)):
-                        point.field(f"entry_{key}", float(value))
+                    if type(value) is float or isinstance(value, (int, float)):
+                        field(f"entry_{key}", float(value))
 
             # Add exit indicators
             if exit_indicators:
                 for key, value in exit_indicators.items():
-                    if isinstance(value, (int, float)):
-                        point.field(f"exit_{key}", float(value))
+                    if type(value) is float or isinstance(value, (int, float)):
+                        field(f"exit_{key}", float(value))
 
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            point.time(self._ts(timestamp), self.write_precision)
+            self._submit(point)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_trade_details error: {e}")
@@ -538,7 +1305,7 @@ class InfluxManager:
                               approval_rate_pct
             timestamp: Timestamp (defaults to now)
         """
-        if not self.is_connected():
+        if not self._connected:
             return False
 
         try:
@@ -572,8 +1339,8 @@ class InfluxManager:
             if 'approval_rate_pct' in health_metrics:
                 point.field("approval_rate_pct", float(health_metrics['approval_rate_pct']))
 
-            point.time(timestamp or datetime.utcnow(), WritePrecision.NS)
-            self.write_api.write(bucket=self.bucket, record=point)
+            point.time(self._ts(timestamp), self.write_precision)
+            self._submit(point)
             return True
         except Exception as e:
             log.error(f"InfluxDB write_strategy_health error: {e}")
@@ -592,24 +1359,46 @@ class InfluxManager:
         Returns:
             List of tick records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            end = end or 'now()'
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: {start}, stop: {end})
-              |> filter(fn: (r) => r["_measurement"] == "ticks")
-              |> filter(fn: (r) => r["symbol"] == "{symbol}")
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            result = self.query_api.query_stream(query=_Q_TICK_RANGE, params={
+                'bucket': self.bucket, 'symbol': symbol,
+                'start': _flux_time(start), 'stop': _flux_time(end)
+            })
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_tick_range error: {e}")
             return []
     
+    def query_tick_range_iter(self, symbol: str, start: str, end: str = None) -> Iterator[dict]:
+        """
+        Stream tick data for a time range, one record at a time.
+        
+        Memory stays flat however long the range is, e.g. for backtests.
+        
+        Args:
+            symbol: Symbol name
+            start: ISO format or relative time like '-1h', '-1d'
+            end: ISO format or 'now()' (defaults to now)
+            
+        Yields:
+            Tick records
+        """
+        if self.client is None:
+            return
+        
+        try:
+            stream = self.query_api.query_stream(query=_Q_TICK_RANGE, params={
+                'bucket': self.bucket, 'symbol': symbol,
+                'start': _flux_time(start), 'stop': _flux_time(end)
+            })
+        except Exception as e:
+            log.error(f"InfluxDB query_tick_range_iter error: {e}")
+            return
+        yield from self._iter_query_result(stream)
+    
     def query_indicators(self, symbol: str, indicator_type: str,
                         start: str = '-1h', end: str = 'now()'):
         """
@@ -624,19 +1413,15 @@ class InfluxManager:
         Returns:
             List of indicator records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: {start}, stop: {end})
-              |> filter(fn: (r) => r["_measurement"] == "indicators")
-              |> filter(fn: (r) => r["symbol"] == "{symbol}")
-              |> filter(fn: (r) => r["indicator_type"] == "{indicator_type}")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            result = self.query_api.query_stream(query=_Q_INDICATORS, params={
+                'bucket': self.bucket, 'symbol': symbol, 'field': indicator_type,
+                'start': _flux_time(start), 'stop': _flux_time(end)
+            })
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_indicators error: {e}")
             return []
@@ -654,20 +1439,15 @@ class InfluxManager:
         Returns:
             List of position snapshot records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: {start})
-              |> filter(fn: (r) => r["_measurement"] == "positions")
-              |> filter(fn: (r) => r["strategy_id"] == "{strategy_id}")
-              |> filter(fn: (r) => r["symbol"] == "{symbol}")
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            result = self.query_api.query_stream(query=_Q_POSITION_HISTORY, params={
+                'bucket': self.bucket, 'strategy_id': strategy_id, 'symbol': symbol,
+                'start': _flux_time(start)
+            })
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_position_history error: {e}")
             return []
@@ -682,19 +1462,15 @@ class InfluxManager:
         Returns:
             List of SL update records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: -24h)
-              |> filter(fn: (r) => r["_measurement"] == "trailing_sl")
-              |> filter(fn: (r) => r["trade_id"] == "{trade_id}")
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            result = self.query_api.query_stream(query=_Q_SL_TIMELINE, params={
+                'bucket': self.bucket, 'trade_id': trade_id,
+                'trade_slot': trade_slot(trade_id)
+            })
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_sl_timeline error: {e}")
             return []
@@ -710,19 +1486,15 @@ class InfluxManager:
         Returns:
             List of strategy metric records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: {start})
-              |> filter(fn: (r) => r["_measurement"] == "strategy_metrics")
-              |> filter(fn: (r) => r["strategy_id"] == "{strategy_id}")
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            result = self.query_api.query_stream(query=_Q_STRATEGY_PERFORMANCE, params={
+                'bucket': self.bucket, 'strategy_id': strategy_id,
+                'start': _flux_time(start)
+            })
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_strategy_performance error: {e}")
             return []
@@ -738,43 +1510,77 @@ class InfluxManager:
         Returns:
             List of trade records
         """
-        if not self.is_connected():
+        if self.client is None:
             return []
         
         try:
-            strategy_filter = f'|> filter(fn: (r) => r["strategy_id"] == "{strategy_id}")' if strategy_id else ''
-            
-            query = f'''
-            from(bucket: "{self.bucket}")
-              |> range(start: {start})
-              |> filter(fn: (r) => r["_measurement"] == "trades")
-              {strategy_filter}
-              |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")
-            '''
-            result = self.query_api.query(query=query)
-            return self._parse_query_result(result)
+            params = {'bucket': self.bucket, 'start': _flux_time(start)}
+            if strategy_id:
+                params['strategy_id'] = strategy_id
+            result = self.query_api.query_stream(
+                query=_Q_STRATEGY_TRADES_SUMMARY if strategy_id else _Q_TRADES_SUMMARY,
+                params=params
+            )
+            return list(self._iter_query_result(result))
         except Exception as e:
             log.error(f"InfluxDB query_trades_summary error: {e}")
             return []
     
-    def _parse_query_result(self, result) -> list:
+    def query_many(self, queries: List[tuple]) -> List[list]:
         """
-        Parse Flux query result to list of dicts.
+        Run several Flux queries concurrently.
+        
+        Each query is still its own request, but they overlap on the pooled
+        keep-alive connections, so a dashboard refresh waits about as long
+        as its slowest query instead of the sum of all of them.
         
         Args:
-            result: Query result object
+            queries: (template, params) pairs; values go in params, as in the
+                query_* methods, never formatted into the template
             
         Returns:
-            List of record dictionaries
+            One list of records per query, in order ([] for a failed query)
         """
-        records = []
+        if self.client is None:
+            return [[] for _ in queries]
+        
+        with self._query_pool_lock:
+            if self._query_pool is None:
+                self._query_pool = ThreadPoolExecutor(
+                    max_workers=QUERY_CONCURRENCY, thread_name_prefix="influx-query"
+                )
+        return list(self._query_pool.map(lambda pair: self._run_query(*pair), queries))
+    
+    def _run_query(self, query: str, params: dict) -> list:
+        """Run one parameterized Flux query for query_many()."""
         try:
-            for table in result:
-                for record in table.records:
-                    records.append(record.values)
+            return list(self._iter_query_result(
+                self.query_api.query_stream(query=query, params=params)
+            ))
+        except Exception as e:
+            log.error(f"InfluxDB query_many error: {e}")
+            return []
+    
+    def _iter_query_result(self, stream) -> Iterator[dict]:
+        """
+        Yield record dicts from a streamed Flux query result.
+        
+        Records are parsed off the response as they arrive, so no FluxTable
+        copy of the whole result is ever built.
+        
+        Args:
+            stream: Record stream from query_api.query_stream()
+            
+        Yields:
+            Record dictionaries
+        """
+        try:
+            for record in stream:
+                yield record.values
         except Exception as e:
             log.error(f"InfluxDB parse error: {e}")
-        return records
+        finally:
+            stream.close()  # Releases the HTTP response if the caller stops early
     
     # ==================== Health & Maintenance ====================
     
@@ -785,7 +1591,7 @@ class InfluxManager:
         Returns:
             True if connected and responsive
         """
-        if not self.is_connected():
+        if self.client is None:
             return False
         
         try:
@@ -801,7 +1607,7 @@ class InfluxManager:
         Returns:
             Bucket info dict
         """
-        if not self.is_connected():
+        if self.client is None:
             return {}
         
         try:
@@ -818,14 +1624,60 @@ class InfluxManager:
             log.error(f"InfluxDB get_bucket_info error: {e}")
         return {}
     
+    def get_write_stats(self) -> dict:
+        """
+        Get write buffer statistics.
+        
+        Returns:
+            Dict with queued points and points lost to overflow or failed writes
+        """
+        return {
+            'queued': self._queued_points,
+            'overflow_count': self.overflow_count,
+            'dropped_points': self.dropped_points
+        }
+    
+    def flush(self):
+        """Write everything buffered so far from the calling thread."""
+        if self.client is None:
+            return
+        
+        while True:
+            batch, stop = self._drain(0)
+            if stop:
+                self._buffer.put(_STOP)  # close() is in progress: leave the sentinel to the flusher
+            batch.extend(self._take_ticks())
+            if batch:
+                self._write_points(batch)
+            if stop or not batch:
+                break
+        self._flush_udp()
+    
     def close(self):
-        """Close InfluxDB connections."""
-        if self.is_connected():
+        """Flush buffered points and close InfluxDB connections."""
+        if self.client is not None:
+            self._connected = False
             try:
+                if self._flusher is not None:
+                    self._buffer.put(_STOP)
+                    self._flusher.join()
+                    self._flusher = None
+                if self._render_pool is not None:
+                    self._render_pool.shutdown()
+                    self._render_pool = None
+                if self._query_pool is not None:
+                    self._query_pool.shutdown()
+                    self._query_pool = None
+                if self.udp_socket is not None:
+                    self._flush_udp()
+                    self.udp_socket.close()
+                    self.udp_socket = None
                 if self.write_api:
                     self.write_api.close()
                 if self.client:
                     self.client.close()
+                # Writers check _connected and queries self.client, so later calls return at once
+                self.client = None
                 log.info("InfluxDB connections closed")
             except Exception as e:
                 log.error(f"InfluxDB close error: {e}")
@@ -9,14 +9,36 @@ Redis Key Schema:
 - sl:{trade_id} → Trailing SL state
 - stats:strategy:{strategy_id} → Strategy statistics
 - stats:daily → Daily aggregate stats
+- strategies → SET of strategy IDs that have opened trades
 """
 
 import redis
 import json
+from functools import lru_cache
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
 import logging
 
+
+@lru_cache(maxsize=1024)
+def _isoformat(value) -> str:
+    """ISO string for a datetime; ticks for many symbols share the same timestamp."""
+    return value.isoformat()
+
+
+try:
+    import orjson
+    
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, default=_isoformat, option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: dict) -> str:
+        return json.dumps(data, default=_isoformat)
+    
+    _loads = json.loads
+
 log = logging.getLogger(__name__)
 
 
@@ -66,9 +88,26 @@ class RedisManager:
         """Check if Redis is connected."""
         return self.client is not None
     
+    def pipeline(self):
+        """
+        Create a non-transactional pipeline for coalescing writes.
+        
+        Returns:
+            Pipeline or None if Redis is not connected
+        """
+        if not self.is_connected():
+            return None
+        return self.client.pipeline(transaction=False)
+    
+    def _target(self, pipe):
+        """Return the pipeline to queue on, or the client for an immediate call."""
+        # An empty pipeline is falsy (len() == 0), so compare against None
+        return self.client if pipe is None else pipe
+    
     # ==================== Position Management ====================
     
-    def set_position(self, strategy_id: str, symbol: str, position_data: dict, ttl: int = 86400):
+    def set_position(self, strategy_id: str, symbol: str, position_data: dict, ttl: int = 86400,
+                     pipe=None):
         """
         Store position with TTL (default 24 hours).
         
@@ -77,13 +116,14 @@ class RedisManager:
             symbol: Symbol name
             position_data: Position details dict
             ttl: Time to live in seconds
+            pipe: Optional pipeline to queue the write on instead of sending it
         """
         if not self.is_connected():
             return False
         
         try:
             key = f"position:{strategy_id}:{symbol}"
-            self.client.setex(key, ttl, json.dumps(position_data))
+            self._target(pipe).setex(key, ttl, _dumps(position_data))
             return True
         except Exception as e:
             log.error(f"Redis set_position error: {e}")
@@ -106,7 +146,7 @@ class RedisManager:
         try:
             key = f"position:{strategy_id}:{symbol}"
             data = self.client.get(key)
-            return json.loads(data) if data else None
+            return _loads(data) if data else None
         except Exception as e:
             log.error(f"Redis get_position error: {e}")
             return None
@@ -126,26 +166,27 @@ class RedisManager:
             for key in self.client.scan_iter("position:*"):
                 data = self.client.get(key)
                 if data:
-                    positions[key] = json.loads(data)
+                    positions[key] = _loads(data)
             return positions
         except Exception as e:
             log.error(f"Redis get_all_positions error: {e}")
             return {}
     
-    def delete_position(self, strategy_id: str, symbol: str):
+    def delete_position(self, strategy_id: str, symbol: str, pipe=None):
         """
         Remove closed position.
         
         Args:
             strategy_id: Strategy identifier
             symbol: Symbol name
+            pipe: Optional pipeline to queue the delete on
         """
         if not self.is_connected():
             return False
         
         try:
             key = f"position:{strategy_id}:{symbol}"
-            self.client.delete(key)
+            self._target(pipe).delete(key)
             return True
         except Exception as e:
             log.error(f"Redis delete_position error: {e}")
@@ -153,7 +194,7 @@ class RedisManager:
     
     # ==================== Real-time Indicators ====================
     
-    def set_indicators(self, symbol: str, indicators: dict, ttl: int = 300):
+    def set_indicators(self, symbol: str, indicators: dict, ttl: int = 300, pipe=None):
         """
         Cache indicator values (default 5-min TTL).
         
@@ -161,13 +202,14 @@ class RedisManager:
             symbol: Symbol name
             indicators: Indicator values dict
             ttl: Time to live in seconds
+            pipe: Optional pipeline to queue the write on
         """
         if not self.is_connected():
             return False
         
         try:
             key = f"indicators:{symbol}"
-            self.client.setex(key, ttl, json.dumps(indicators))
+            self._target(pipe).setex(key, ttl, _dumps(indicators))
             return True
         except Exception as e:
             log.error(f"Redis set_indicators error: {e}")
@@ -189,14 +231,14 @@ class RedisManager:
         try:
             key = f"indicators:{symbol}"
             data = self.client.get(key)
-            return json.loads(data) if data else None
+            return _loads(data) if data else None
         except Exception as e:
             log.error(f"Redis get_indicators error: {e}")
             return None
     
     # ==================== Latest Tick Data ====================
     
-    def set_latest_tick(self, symbol: str, tick_data: dict, ttl: int = 60):
+    def set_latest_tick(self, symbol: str, tick_data: dict, ttl: int = 60, pipe=None):
         """
         Store most recent tick (1-min TTL).
         
@@ -204,20 +246,15 @@ class RedisManager:
             symbol: Symbol name
             tick_data: Tick data dict
             ttl: Time to live in seconds
+            pipe: Optional pipeline to queue the write on
         """
         if not self.is_connected():
             return False
         
         try:
             key = f"tick:latest:{symbol}"
-            # Convert datetime objects to ISO format strings
-            serializable_data = {}
-            for k, v in tick_data.items():
-                if hasattr(v, 'isoformat'):  # datetime object
-                    serializable_data[k] = v.isoformat()
-                else:
-                    serializable_data[k] = v
-            self.client.setex(key, ttl, json.dumps(serializable_data))
+            # Datetimes are stored as ISO strings (via the serializer's default hook)
+            self._target(pipe).setex(key, ttl, _dumps(tick_data))
             return True
         except Exception as e:
             log.error(f"Redis set_latest_tick error: {e}")
@@ -239,27 +276,28 @@ class RedisManager:
         try:
             key = f"tick:latest:{symbol}"
             data = self.client.get(key)
-            return json.loads(data) if data else None
+            return _loads(data) if data else None
         except Exception as e:
             log.error(f"Redis get_latest_tick error: {e}")
             return None
     
     # ==================== Trailing SL State ====================
     
-    def set_sl_state(self, trade_id: str, sl_data: dict):
+    def set_sl_state(self, trade_id: str, sl_data: dict, pipe=None):
         """
         Store trailing SL state.
         
         Args:
             trade_id: Trade identifier
             sl_data: SL state dict
+            pipe: Optional pipeline to queue the write on
         """
         if not self.is_connected():
             return False
         
         try:
             key = f"sl:{trade_id}"
-            self.client.set(key, json.dumps(sl_data))
+            self._target(pipe).set(key, _dumps(sl_data))
             return True
         except Exception as e:
             log.error(f"Redis set_sl_state error: {e}")
@@ -281,7 +319,7 @@ class RedisManager:
         try:
             key = f"sl:{trade_id}"
             data = self.client.get(key)
-            return json.loads(data) if data else None
+            return _loads(data) if data else None
         except Exception as e:
             log.error(f"Redis get_sl_state error: {e}")
             return None
@@ -352,6 +390,40 @@ class RedisManager:
             log.error(f"Redis get_strategy_stats error: {e}")
             return {}
     
+    def add_strategy(self, strategy_id: str, pipe=None):
+        """
+        Register strategy in the set of strategies with trades.
+        
+        Args:
+            strategy_id: Strategy identifier
+            pipe: Optional pipeline to queue the write on
+        """
+        if not self.is_connected():
+            return False
+        
+        try:
+            self._target(pipe).sadd("strategies", strategy_id)
+            return True
+        except Exception as e:
+            log.error(f"Redis add_strategy error: {e}")
+            return False
+    
+    def get_strategies(self) -> List[str]:
+        """
+        Get all registered strategy IDs.
+        
+        Returns:
+            List of strategy identifiers
+        """
+        if not self.is_connected():
+            return []
+        
+        try:
+            return list(self.client.smembers("strategies"))
+        except Exception as e:
+            log.error(f"Redis get_strategies error: {e}")
+            return []
+    
     # ==================== Daily Aggregates ====================
     
     def set_daily_stat(self, metric: str, value: float):
@@ -413,7 +485,7 @@ class RedisManager:
         try:
             pipe = self.client.pipeline()
             for key, data in positions.items():
-                pipe.setex(key, 86400, json.dumps(data))
+                pipe.setex(key, 86400, _dumps(data))
             pipe.execute()
             return True
         except Exception as e:
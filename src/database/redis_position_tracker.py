@@ -4,6 +4,7 @@ Integrates with data manager to keep position state synchronized
 """
 import json
 import logging
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 import redis
@@ -136,7 +137,7 @@ class RedisPositionTracker:
 
         try:
             key = f"sl:{trade_id}"
-            sl_data['last_update'] = datetime.now().isoformat()
+            sl_data['updated_at_ns'] = time.time_ns()
             self.redis.set(key, json.dumps(sl_data), ex=86400)  # 24h TTL
             logger.debug(f"Updated trailing SL for {trade_id}")
         except Exception as e:
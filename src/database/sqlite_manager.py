@@ -6,19 +6,43 @@ Time-series data goes to InfluxDB.
 This keeps SQLite fast and focused.
 
 Schema:
-- trades: Trade metadata (entry/exit, P&L, duration)
-- signal_conditions: Entry/exit signal conditions (JSON)
+- trades: Trade metadata (entry/exit, P&L, duration), with the entry/exit
+  signal conditions inlined as JSON
+- signal_conditions: Signal conditions stored separately (JSON)
+
+Concurrency:
+- One writer connection (WAL, autocommit) owned by a background thread;
+  writes are queued and committed in group transactions
+- One read connection per calling thread
 """
 
 import sqlite3
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional, List, Dict
 import json
 import logging
+import queue
+import threading
 from pathlib import Path
 
 log = logging.getLogger(__name__)
 
+WRITE_BATCH_MAX = 500  # Statements per group commit
+MMAP_SIZE_BYTES = 256 * 1024 * 1024  # Memory-mapped reads of the database file
+
+_STOP = object()  # Sentinel that stops the writer thread
+_VACUUM = object()  # Sentinel that runs VACUUM on the writer thread
+
+# trades columns holding the conditions JSON, by signal type
+_CONDITION_COLUMNS = {'entry': 'entry_conditions_json', 'exit': 'exit_conditions_json'}
+
+
+def _dump_conditions(conditions: Optional[dict]) -> Optional[str]:
+    """Serialize signal conditions compactly (None when there are none)."""
+    return json.dumps(conditions, separators=(',', ':')) if conditions else None
+
 
 class SQLiteManager:
     """
@@ -30,6 +54,7 @@ class SQLiteManager:
     - Performance statistics
     - Fast indexed queries
     - Thread-safe operations
+    - Group-committed writes off the caller's thread
     """
     
     def __init__(self, db_path='data/velox_trades.db'):
@@ -44,15 +69,124 @@ class SQLiteManager:
         # Create data directory if needed
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        
         try:
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            # Writer connection: autocommit so the writer thread controls transactions
+            self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
             self.conn.row_factory = sqlite3.Row  # Dict-like access
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute('PRAGMA temp_store=MEMORY')
+            self.conn.execute(f'PRAGMA mmap_size={MMAP_SIZE_BYTES}')
             self._create_schema()
+            
+            self._writer = threading.Thread(
+                target=self._write_loop, name="sqlite-writer", daemon=True
+            )
+            self._writer.start()
             log.info(f"✓ SQLite connected: {db_path}")
         except Exception as e:
             log.error(f"❌ SQLite initialization failed: {e}")
             raise
     
+    # ==================== Connections & Writer ====================
+    
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's read connection, after pending writes have landed.
+        
+        Returns:
+            Thread-local connection
+        """
+        self._wait_for_writes()
+        
+        if self.db_path == ':memory:':
+            return self.conn  # Private in-memory DB: only the writer connection sees it
+        
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f'PRAGMA mmap_size={MMAP_SIZE_BYTES}')
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+    
+    def _wait_for_writes(self):
+        """
+        Block until the writes queued so far are committed.
+        
+        Waits on a barrier placed behind them rather than on queue.join(),
+        which would also wait for writes queued later and, under a steady
+        write stream, might never return.
+        """
+        if not self._write_queue.unfinished_tasks or not self._writer.is_alive():
+            return
+        barrier = threading.Event()
+        self._write_queue.put(barrier)
+        barrier.wait()
+    
+    def _execute_write(self, sql: str, params: tuple):
+        """Queue a write statement for the writer thread."""
+        self._write_queue.put((sql, params))
+    
+    def _write_loop(self):
+        """Commit queued writes in batches until close()."""
+        while True:
+            batch = [self._write_queue.get()]
+            
+            # Group everything already queued into the same transaction
+            while len(batch) < WRITE_BATCH_MAX:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stopping = _STOP in batch
+            statements = [item for item in batch if type(item) is tuple]
+            if statements:
+                self._commit_batch(statements)
+            if _VACUUM in batch:
+                self._vacuum()
+            for item in batch:
+                if type(item) is threading.Event:
+                    item.set()  # A reader waiting for everything queued before it
+                self._write_queue.task_done()
+            if stopping:
+                break
+    
+    def _commit_batch(self, statements: List[tuple]):
+        """
+        Run statements in one transaction, falling back to one at a time on error.
+        
+        Args:
+            statements: List of (sql, params) tuples
+        """
+        try:
+            # IMMEDIATE takes the write lock up front, so contention with another
+            # process surfaces here rather than partway through the batch
+            self.conn.execute('BEGIN IMMEDIATE')
+            for sql, group in groupby(statements, key=itemgetter(0)):
+                self.conn.executemany(sql, [params for _, params in group])
+            self.conn.execute('COMMIT')
+            return
+        except Exception as e:
+            if self.conn.in_transaction:
+                self.conn.execute('ROLLBACK')
+            log.warning(f"SQLite batch of {len(statements)} failed ({e}), retrying individually")
+        
+        # Isolate the failing statement so the rest of the batch still lands
+        for sql, params in statements:
+            try:
+                self.conn.execute(sql, params)
+            except Exception as e:
+                log.error(f"SQLite write failed: {e} (params={params})")
+    
     def _create_schema(self):
         """Create optimized database schema."""
         cursor = self.conn.cursor()
@@ -74,11 +208,19 @@ class SQLiteManager:
             exit_reason TEXT,
             duration_seconds INTEGER,
             status TEXT DEFAULT 'open',
+            entry_conditions_json TEXT,
+            exit_conditions_json TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         ''')
         
+        # Databases created before the conditions columns existed
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(trades)')}
+        for column in _CONDITION_COLUMNS.values():
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE trades ADD COLUMN {column} TEXT')
+        
         # Indexes for fast queries
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_strategy_id ON trades(strategy_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_symbol ON trades(symbol)')
@@ -107,9 +249,9 @@ class SQLiteManager:
     
     def insert_trade(self, trade_id: str, strategy_id: str, symbol: str,
                     action: str, entry_time: datetime, entry_price: float,
-                    quantity: int) -> bool:
+                    quantity: int, entry_conditions: dict = None) -> bool:
         """
-        Insert new trade.
+        Insert new trade (queued for the writer thread).
         
         Args:
             trade_id: Unique trade identifier
@@ -119,20 +261,21 @@ class SQLiteManager:
             entry_time: Entry timestamp
             entry_price: Entry price
             quantity: Trade quantity
+            entry_conditions: Entry signal conditions, stored on the trade row
             
         Returns:
-            True if successful
+            True once queued; SQL errors (e.g. a duplicate trade_id) are
+            logged by the writer thread when the batch commits
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self._execute_write('''
             INSERT INTO trades (trade_id, strategy_id, symbol, action,
-                              entry_time, entry_price, quantity, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'open')
+                              entry_time, entry_price, quantity, status,
+                              entry_conditions_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'open', ?)
             ''', (trade_id, strategy_id, symbol, action, entry_time,
-                 entry_price, quantity))
-            self.conn.commit()
-            log.info(f"✓ Trade {trade_id} inserted: {strategy_id} {action} {symbol} @ {entry_price}")
+                 entry_price, quantity, _dump_conditions(entry_conditions)))
+            log.debug(f"Trade {trade_id} insert queued: {strategy_id} {action} {symbol} @ {entry_price}")
             return True
         except Exception as e:
             log.error(f"Failed to insert trade {trade_id}: {e}")
@@ -140,9 +283,9 @@ class SQLiteManager:
     
     def update_trade_exit(self, trade_id: str, exit_time: datetime,
                          exit_price: float, pnl: float, pnl_pct: float,
-                         exit_reason: str) -> bool:
+                         exit_reason: str, exit_conditions: dict = None) -> bool:
         """
-        Update trade with exit details.
+        Update trade with exit details (queued for the writer thread).
         
         Args:
             trade_id: Trade identifier
@@ -151,26 +294,28 @@ class SQLiteManager:
             pnl: Profit/Loss amount
             pnl_pct: Profit/Loss percentage
             exit_reason: Reason for exit
+            exit_conditions: Exit signal conditions, stored on the trade row
             
         Returns:
-            True if successful
+            True once queued; SQL errors are logged by the writer thread
+            when the batch commits
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self._execute_write('''
             UPDATE trades
             SET exit_time = ?,
                 exit_price = ?,
                 pnl = ?,
                 pnl_pct = ?,
                 exit_reason = ?,
+                exit_conditions_json = ?,
                 duration_seconds = CAST((julianday(?) - julianday(entry_time)) * 86400 AS INTEGER),
                 status = 'closed',
                 updated_at = CURRENT_TIMESTAMP
             WHERE trade_id = ?
-            ''', (exit_time, exit_price, pnl, pnl_pct, exit_reason, exit_time, trade_id))
-            self.conn.commit()
-            log.info(f"✓ Trade {trade_id} closed: P&L {pnl:.2f} ({pnl_pct:.2f}%)")
+            ''', (exit_time, exit_price, pnl, pnl_pct, exit_reason,
+                 _dump_conditions(exit_conditions), exit_time, trade_id))
+            log.debug(f"Trade {trade_id} exit queued: P&L {pnl:.2f} ({pnl_pct:.2f}%)")
             return True
         except Exception as e:
             log.error(f"Failed to update trade {trade_id}: {e}")
@@ -187,7 +332,7 @@ class SQLiteManager:
             Trade dict or None
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             cursor.execute('SELECT * FROM trades WHERE trade_id = ?', (trade_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -206,7 +351,7 @@ class SQLiteManager:
             List of trade dicts
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             if strategy_id:
                 cursor.execute('''
                 SELECT * FROM trades
@@ -236,7 +381,7 @@ class SQLiteManager:
             List of trade dicts
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             if strategy_id:
                 cursor.execute('''
                 SELECT * FROM trades
@@ -268,7 +413,7 @@ class SQLiteManager:
             List of trade dicts
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             cursor.execute('''
             SELECT * FROM trades
             WHERE strategy_id = ?
@@ -294,12 +439,10 @@ class SQLiteManager:
             timestamp: Signal timestamp
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
+            self._execute_write('''
             INSERT INTO signal_conditions (trade_id, signal_type, conditions_json, timestamp)
             VALUES (?, ?, ?, ?)
             ''', (trade_id, signal_type, json.dumps(conditions), timestamp))
-            self.conn.commit()
             log.debug(f"✓ Signal conditions stored for {trade_id}")
         except Exception as e:
             log.error(f"Failed to insert signal conditions: {e}")
@@ -316,7 +459,15 @@ class SQLiteManager:
             Conditions dict or None
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
+            column = _CONDITION_COLUMNS.get(signal_type)
+            if column:
+                cursor.execute(f'SELECT {column} FROM trades WHERE trade_id = ?', (trade_id,))
+                row = cursor.fetchone()
+                if row and row[0]:
+                    return json.loads(row[0])
+            
+            # Conditions stored through insert_signal_conditions
             cursor.execute('''
             SELECT conditions_json FROM signal_conditions
             WHERE trade_id = ? AND signal_type = ?
@@ -341,7 +492,7 @@ class SQLiteManager:
             Statistics dict
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             cursor.execute('''
             SELECT
                 COUNT(*) as total_trades,
@@ -394,7 +545,7 @@ class SQLiteManager:
             if not date:
                 date = datetime.now().strftime('%Y-%m-%d')
             
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             cursor.execute('''
             SELECT
                 COUNT(*) as total_trades,
@@ -426,7 +577,7 @@ class SQLiteManager:
             Performance dict
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             cursor.execute('''
             SELECT
                 COUNT(*) as total_trades,
@@ -448,7 +599,17 @@ class SQLiteManager:
     # ==================== Maintenance ====================
     
     def vacuum(self):
-        """Optimize database (reclaim space, rebuild indexes)."""
+        """
+        Optimize database (reclaim space, rebuild indexes).
+        
+        Runs on the writer thread, which owns the writer connection and never
+        has a transaction open between batches; returns once it is done.
+        """
+        self._write_queue.put(_VACUUM)
+        self._wait_for_writes()
+    
+    def _vacuum(self):
+        """Run VACUUM on the writer connection. Writer thread only."""
         try:
             self.conn.execute('VACUUM')
             log.info("✓ Database vacuumed")
@@ -476,7 +637,7 @@ class SQLiteManager:
             Dict of {table_name: row_count}
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._read_conn().cursor()
             counts = {}
             
             cursor.execute("SELECT COUNT(*) FROM trades")
@@ -491,8 +652,15 @@ class SQLiteManager:
             return {}
     
     def close(self):
-        """Close database connection."""
+        """Flush queued writes and close database connections."""
         try:
+            if self._writer.is_alive():
+                self._write_queue.put(_STOP)
+                self._writer.join()
+            with self._readers_lock:
+                for conn in self._readers:
+                    conn.close()
+                self._readers.clear()
             self.conn.close()
             log.info("SQLite connection closed")
         except Exception as e:
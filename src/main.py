@@ -27,7 +27,7 @@ from core.trailing_sl import TrailingStopLossManager, TrailingStopLossType
 from core.time_controller import TimeController
 from core.candle_aggregator import CandleAggregator
 from core.warmup_manager import WarmupManager
-from database.data_manager import DataManager
+from database.data_manager import get_data_manager
 
 
 class VeloxSystem:
@@ -71,7 +71,7 @@ class VeloxSystem:
         
         # Database manager for comprehensive logging (initialize early)
         try:
-            self.db_manager = DataManager()
+            self.db_manager = get_data_manager()
             self.logger.info("Database manager initialized")
         except Exception as e:
             self.logger.warning(f"Database manager initialization failed: {e} - continuing without database")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard API's closed-trades keyset pagination.
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from dashboard.api.data_service import DataService
+
+# exit_time per trade; T2-T4 closed on the same tick
+CLOSED_TRADES = {
+    'T1': '2026-01-01T11:05:00',
+    'T2': '2026-01-01T11:04:00',
+    'T3': '2026-01-01T11:04:00',
+    'T4': '2026-01-01T11:04:00',
+    'T5': '2026-01-01T11:03:00',
+    'T6': '2026-01-01T11:02:00',
+}
+# Newest exit first, trade_id descending within a tie
+EXPECTED_ORDER = ['T1', 'T4', 'T3', 'T2', 'T5', 'T6']
+
+
+@pytest.fixture
+def service(tmp_path):
+    """DataService reading a scratch SQLite database, without Influx or Redis."""
+    db_path = tmp_path / 'velox.db'
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+    CREATE TABLE trades (
+        trade_id TEXT PRIMARY KEY, strategy_id TEXT, symbol TEXT, action TEXT,
+        entry_time TIMESTAMP, entry_price REAL, exit_time TIMESTAMP, exit_price REAL,
+        quantity INTEGER, pnl REAL, pnl_pct REAL, exit_reason TEXT,
+        duration_seconds INTEGER, status TEXT,
+        max_favorable_excursion REAL, max_adverse_excursion REAL
+    )
+    ''')
+    for trade_id, exit_time in CLOSED_TRADES.items():
+        conn.execute(
+            "INSERT INTO trades VALUES (?, 's1', 'RELIANCE', 'BUY', '2026-01-01T10:00:00', 100,"
+            " ?, 101, 1, 1.0, 1.0, 'TP', 600, 'CLOSED', NULL, NULL)",
+            (trade_id, exit_time)
+        )
+    conn.commit()
+    conn.close()
+
+    data_service = DataService.__new__(DataService)
+    data_service.sqlite_path = str(db_path)
+    return data_service
+
+
+def test_cursor_pages_through_exit_time_ties(service):
+    """An "exit_time|trade_id" cursor neither skips nor repeats tied trades."""
+    seen = []
+    cursor = None
+    while True:
+        page = service.get_closed_trades(limit=2, cursor=cursor)
+        seen.extend(trade.trade_id for trade in page)
+        if len(page) < 2:
+            break
+        cursor = page[-1].page_cursor
+
+    assert seen == EXPECTED_ORDER
+
+
+def test_bare_exit_time_cursor(service):
+    """The legacy before_exit_time cursor resumes strictly before that time."""
+    page = service.get_closed_trades(limit=10, cursor='2026-01-01T11:04:00')
+
+    assert [trade.trade_id for trade in page] == ['T5', 'T6']
+
+
+def test_next_cursor(service, monkeypatch, tmp_path):
+    """next_cursor is set on a full page and null on a short one."""
+    from fastapi.testclient import TestClient
+
+    monkeypatch.chdir(tmp_path)  # The module-level DataService opens data/velox.db
+    from dashboard.api import rest_api
+    monkeypatch.setattr(rest_api, 'data_service', service)
+    client = TestClient(rest_api.app)
+
+    first = json.loads(client.get('/api/trades/closed', params={'limit': 4}).text)
+    assert [trade['trade_id'] for trade in first['trades']] == EXPECTED_ORDER[:4]
+    assert first['next_cursor'] == f"{CLOSED_TRADES['T2']}|T2"
+
+    second = json.loads(client.get('/api/trades/closed', params={
+        'limit': 4, 'cursor': first['next_cursor']
+    }).text)
+    assert [trade['trade_id'] for trade in second['trades']] == EXPECTED_ORDER[4:]
+    assert second['next_cursor'] is None
+
+    legacy = json.loads(client.get('/api/trades/closed', params={
+        'limit': 4, 'before_exit_time': CLOSED_TRADES['T1']
+    }).text)
+    assert [trade['trade_id'] for trade in legacy['trades']] == EXPECTED_ORDER[1:5]
@@ -9,8 +9,14 @@ sys.path.insert(0, 'src')
 from database.redis_manager import RedisManager
 from database.influx_manager import InfluxManager
 from datetime import datetime
+import re
 import time
 
+from influxdb_client.client._base import _BaseQueryApi
+
+# Flux builtins that can follow "name:" or "==" in the query templates
+FLUX_BUILTINS = {'true', 'false', 'last'}
+
 def test_redis():
     """Test Redis Manager."""
     print("\n" + "="*60)
@@ -186,6 +192,76 @@ def test_influx():
     return True
 
 
+class _CapturingQueryApi:
+    """Records (query, params) instead of talking to InfluxDB."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def query_stream(self, query, org=None, params=None):
+        self.calls.append((query, params))
+        return (record for record in ())
+
+
+def _flux_option_names(params):
+    """Names influxdb-client declares (as options) for a params dict."""
+    return {stmt.assignment.id.name for stmt in _BaseQueryApi._build_flux_ast(params).body}
+
+
+def _flux_value_identifiers(query):
+    """Bare identifiers a query reads as values (argument values and comparands)."""
+    names = re.findall(r'(?:==|:)\s*([A-Za-z_]\w*)\b(?!\s*\()', query)
+    return set(names) - FLUX_BUILTINS
+
+
+def _check_flux_calls(calls):
+    """Every identifier a template reads must be a declared param, and vice versa."""
+    assert calls, "no query was issued"
+    for query, params in calls:
+        assert 'params.' not in query, query
+        assert _flux_value_identifiers(query) == _flux_option_names(params), query
+
+
+def test_influx_query_params():
+    """InfluxManager templates only reference identifiers bound from params."""
+    influx = InfluxManager(url='http://127.0.0.1:1')
+    influx.client = object()  # Pretend connected; queries go to the capturing API
+    influx.query_api = _CapturingQueryApi()
+    
+    influx.query_tick_range('RELIANCE', start='-1h')
+    list(influx.query_tick_range_iter('RELIANCE', start='-1h', end='now()'))
+    influx.query_indicators('RELIANCE', 'rsi')
+    influx.query_position_history('scalping_pro', 'RELIANCE')
+    influx.query_sl_timeline('T-1')
+    influx.query_strategy_performance('scalping_pro')
+    influx.query_trades_summary()
+    influx.query_trades_summary('scalping_pro')
+    influx.query_many([
+        ('from(bucket: bucket) |> range(start: -1h)', {'bucket': 'trading'}),
+        ('from(bucket: bucket) |> range(start: -1h) |> filter(fn: (r) => r.symbol == symbol)',
+         {'bucket': 'trading', 'symbol': 'RELIANCE'}),
+    ])
+    
+    assert len(influx.query_api.calls) == 10
+    _check_flux_calls(influx.query_api.calls)
+
+
+def test_dashboard_query_params():
+    """Dashboard data service templates only reference identifiers bound from params."""
+    from dashboard.api.data_service import DataService
+    
+    service = DataService.__new__(DataService)
+    service.query_api = _CapturingQueryApi()
+    service.influx_bucket = 'trading'
+    service.influx_org = 'velox'
+    
+    service.get_price_history('RELIANCE', hours=2)
+    service.get_trailing_sl_history('T-1')
+    
+    assert len(service.query_api.calls) == 2
+    _check_flux_calls(service.query_api.calls)
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*60)
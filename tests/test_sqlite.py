@@ -145,6 +145,74 @@ def test_sqlite():
     return True
 
 
+def _insert_trades(db, count, start=0):
+    """Queue count open trades with sequential ids."""
+    now = datetime.now()
+    for i in range(start, start + count):
+        db.insert_trade(f'TRD{i:04d}', 'scalping_pro', 'RELIANCE', 'BUY', now, 2450.00, 10)
+
+
+def test_read_after_write(tmp_path):
+    """Reads wait for writes queued before them by the same caller."""
+    db = SQLiteManager(str(tmp_path / 'trades.db'))
+    try:
+        _insert_trades(db, 300)
+        assert db.get_table_counts()['trades'] == 300
+        assert db.get_trade('TRD0299')['symbol'] == 'RELIANCE'
+        
+        db.update_trade_exit('TRD0000', datetime.now(), 2465.00, 150.00, 6.12, 'Target hit')
+        assert db.get_trade('TRD0000')['status'] == 'closed'
+    finally:
+        db.close()
+
+
+def test_batch_falls_back_to_single_statements(tmp_path):
+    """One failing statement does not take the rest of its batch down."""
+    db = SQLiteManager(str(tmp_path / 'trades.db'))
+    try:
+        db._wait_for_writes()
+        now = datetime.now()
+        insert = ('INSERT INTO trades (trade_id, strategy_id, symbol, action, '
+                  'entry_time, entry_price, quantity) VALUES (?, ?, ?, ?, ?, ?, ?)')
+        # The duplicate trade_id fails the batch's executemany
+        db._commit_batch([
+            (insert, ('TRD0001', 'scalping_pro', 'TCS', 'BUY', now, 3500.00, 5)),
+            (insert, ('TRD0001', 'scalping_pro', 'TCS', 'BUY', now, 3500.00, 5)),
+            (insert, ('TRD0002', 'scalping_pro', 'INFY', 'BUY', now, 1450.00, 15)),
+        ])
+        assert db.get_table_counts()['trades'] == 2
+        assert db.get_trade('TRD0002')['symbol'] == 'INFY'
+        assert not db.conn.in_transaction
+    finally:
+        db.close()
+
+
+def test_close_flushes_queued_writes(tmp_path):
+    """close() commits everything still queued before closing."""
+    path = str(tmp_path / 'trades.db')
+    db = SQLiteManager(path)
+    _insert_trades(db, 1000)
+    db.close()
+    
+    db = SQLiteManager(path)
+    try:
+        assert db.get_table_counts()['trades'] == 1000
+    finally:
+        db.close()
+
+
+def test_vacuum_runs_on_writer(tmp_path):
+    """vacuum() goes through the writer queue and leaves writes intact."""
+    db = SQLiteManager(str(tmp_path / 'trades.db'))
+    try:
+        _insert_trades(db, 100)
+        db.vacuum()
+        _insert_trades(db, 100, start=100)
+        assert db.get_table_counts()['trades'] == 200
+    finally:
+        db.close()
+
+
 def main():
     """Run tests."""
     print("\n" + "="*60)